@@ -2,15 +2,21 @@ import os
 
 DATA_DIR = os.getenv("DATA_DIR", "/app/data")
 os.makedirs(DATA_DIR, exist_ok=True)
-PERSIST_CHROMA = os.path.join(DATA_DIR, "chroma_db")
 OUTPUTS_BASE = os.path.join(DATA_DIR, "outputs")
 UPLOADS_BASE = os.path.join(DATA_DIR, "uploads")
-for _d in (PERSIST_CHROMA, OUTPUTS_BASE, UPLOADS_BASE):
+for _d in (OUTPUTS_BASE, UPLOADS_BASE):
     os.makedirs(_d, exist_ok=True)
 PROFILE_PICS_BASE = os.path.join(UPLOADS_BASE, "profile_pictures")
 os.makedirs(PROFILE_PICS_BASE, exist_ok=True)
 
 CACHE_FILENAME = "resume_cache.json"
+# Sidecar naming the render signature of the files currently in the output dir.
+RENDER_SIGNATURE_FILENAME = "resume.sig"
+# Generated results kept per user cache file; the oldest are evicted beyond this.
+RESUME_CACHE_MAX_RESULTS = max(1, int(os.getenv("RESUME_CACHE_MAX_RESULTS", "20")))
+# Threads rendering DOCX/LaTeX and converting to PDF, shared by all requests.
+# pdflatex is single-threaded and CPU-bound, so one compile per core by default.
+RENDER_WORKERS = max(1, int(os.getenv("RENDER_WORKERS") or os.cpu_count() or 4))
 
 ALLOWED_PROFILE_IMAGE_TYPES = {
     "image/png": ".png",
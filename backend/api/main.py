@@ -12,6 +12,8 @@ if not os.environ.get("GOOGLE_API_KEY") and os.environ.get("GEMINI_API_KEY"):
 from utils.logging_utils import setup_logging, new_request_id, clear_request_id
 from utils.db_storage import DBStorage, init_db_pool, close_db_pool, init_async_db_pool, close_async_db_pool
 from api.routers import admin, health, jobs, profile, resume, users, donations
+from api.state import USER_STORES
+from llm import agent
 
 setup_logging()
 # Module logger (relies on configured handlers)
@@ -30,8 +32,30 @@ async def lifespan(app: FastAPI):
 
     # Initialize async pool after schema is ready (so vector extension exists)
     await init_async_db_pool()
+
+    # Hold the default model open so its HTTP client (and pooled connections)
+    # outlive individual runs instead of closing when the last run exits.
+    default_model = None
+    try:
+        default_model = agent.resolve_model(agent.DEFAULT_MODEL)
+        await default_model.__aenter__()
+    except Exception as e:
+        logger.warning("Could not pre-open default model %s: %s", agent.DEFAULT_MODEL, e)
+        default_model = None
     yield
+
+    if default_model is not None:
+        try:
+            await default_model.__aexit__(None, None, None)
+        except Exception:
+            pass
     
+    for store in list(USER_STORES.values()):
+        try:
+            await store.aclose()
+        except Exception:
+            pass
+
     logger.info("Closing database pools...")
     await close_async_db_pool()
     close_db_pool()
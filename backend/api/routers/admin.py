@@ -5,6 +5,7 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from api.auth import require_admin
+from api.state import RESUME_CACHE_STATS
 from utils.db_storage import DBStorage
 
 logger = logging.getLogger("betterresume.api.admin")
@@ -20,7 +21,7 @@ async def admin_stats(days: int = Query(default=30, ge=1, le=365), claims: dict
     except Exception:
         logger.exception("Failed to compute admin stats")
         raise HTTPException(status_code=500, detail="Failed to compute statistics")
-    return stats
+    return {**stats, "resume_cache": dict(RESUME_CACHE_STATS)}
 
 
 @router.get("/logs/export")
@@ -1,17 +1,47 @@
+import asyncio
 import hashlib
 import io
 import logging
+import pandas as pd
 from fastapi import APIRouter, HTTPException
 from typing import List
 
 from api.utils import _validate_user_id, get_user_store
 from utils.db_storage import DBStorage
+from utils.ingest import unique_documents
 from utils.logging_utils import set_user_context
 from api.schemas import JobUploadRequest
 
 logger = logging.getLogger("betterresume.api.jobs")
 router = APIRouter()
 
+_PRESENT_TOKENS = ("present", "current", "now")
+_DMY = r"^(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})$"  # DD/MM/YYYY or DD-MM-YYYY
+_MY = r"^(\d{1,2})\/(\d{4})$"  # MM/YYYY
+_YM = r"^(\d{4})[\/\-](\d{1,2})$"  # YYYY/MM
+
+
+def _normalize_dates(col: pd.Series) -> pd.Series:
+    """Normalize a date column to DD/MM/YYYY strings, preserving 'present'.
+
+    Column-wise str.extract instead of a Python function per cell; values that
+    cannot be parsed confidently are left as-is, blanks/NaN become "".
+    """
+    s = col.fillna("").astype(str).str.strip()
+    out = s.copy()
+    out[s.str.lower().isin(_PRESENT_TOKENS)] = "present"
+    dmy = s.str.extract(_DMY)
+    hit = dmy[0].notna()
+    out[hit] = dmy[0][hit].str.zfill(2) + "/" + dmy[1][hit].str.zfill(2) + "/" + dmy[2][hit]
+    my = s.str.extract(_MY)
+    hit = my[0].notna()
+    out[hit] = "01/" + my[0][hit].str.zfill(2) + "/" + my[1][hit]
+    ym = s.str.extract(_YM)
+    hit = ym[0].notna()
+    out[hit] = "01/" + ym[1][hit].str.zfill(2) + "/" + ym[0][hit]
+    return out
+
+
 @router.post("/upload-jobs/{user_id}")
 async def upload_jobs(user_id: str, payload: JobUploadRequest):
     """Accepts a JSON payload of job/entry records and ingests them.
@@ -21,10 +51,9 @@ async def upload_jobs(user_id: str, payload: JobUploadRequest):
     _validate_user_id(user_id)
     set_user_context(user_id)
     storage = DBStorage()
-    storage._ensure_user(user_id)
+    await asyncio.to_thread(storage._ensure_user, user_id)
     store = get_user_store(user_id)
     try:
-        import pandas as pd
         # Build DataFrame from JSON payload
         if not payload.jobs:
             logger.info("Received empty jobs payload for user=%s", user_id)
@@ -37,14 +66,15 @@ async def upload_jobs(user_id: str, payload: JobUploadRequest):
             empty_df = pd.DataFrame(columns=["type","company","location","role","start_date","end_date","description"])  # noqa: E501
             normalized_csv = empty_df.to_csv(index=False).encode("utf-8")
             new_hash = hashlib.sha256(normalized_csv).hexdigest()
-            storage.save_file(
+            await asyncio.to_thread(
+                storage.save_file,
                 user_id=user_id,
                 file_type="jobs_csv",
                 content=normalized_csv,
                 filename=f"jobs_{user_id}.csv",
                 mime_type="text/csv",
             )
-            storage.replace_job_experiences(user_id, [])
+            await asyncio.to_thread(storage.replace_job_experiences, user_id, [])
             return {"status": "ok", "rows_ingested": 0, "hash": new_hash}
 
         # Convert list of models to dicts
@@ -58,42 +88,10 @@ async def upload_jobs(user_id: str, payload: JobUploadRequest):
             raise HTTPException(status_code=400, detail=f"Missing required fields: {', '.join(missing)}")
 
         # Normalize date columns as strings in DD/MM/YYYY, preserve 'present'
-        def _norm_date(val):
-            try:
-                if pd.isna(val):
-                    return ""
-            except Exception:
-                pass
-            s = str(val).strip()
-            if not s:
-                return ""
-            sl = s.lower()
-            if sl in ("present", "current", "now"):
-                return "present"
-            import re as _re
-            m = _re.match(r"^(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})$", s)
-            if m:
-                dd = m.group(1).zfill(2)
-                mm = m.group(2).zfill(2)
-                yyyy = m.group(3)
-                return f"{dd}/{mm}/{yyyy}"
-            m = _re.match(r"^(\d{1,2})\/(\d{4})$", s)  # MM/YYYY
-            if m:
-                mm = m.group(1).zfill(2)
-                yyyy = m.group(2)
-                return f"01/{mm}/{yyyy}"
-            m = _re.match(r"^(\d{4})[\/\-](\d{1,2})$", s)  # YYYY/MM
-            if m:
-                yyyy = m.group(1)
-                mm = m.group(2).zfill(2)
-                return f"01/{mm}/{yyyy}"
-            # leave as-is if cannot confidently parse
-            return s
-
         for col in ["start_date", "end_date"]:
             if col in df.columns:
                 try:
-                    df[col] = df[col].apply(_norm_date)
+                    df[col] = _normalize_dates(df[col])
                 except Exception:
                     pass
 
@@ -108,14 +106,16 @@ async def upload_jobs(user_id: str, payload: JobUploadRequest):
         new_hash = hashlib.sha256(normalized_csv).hexdigest()
 
         # Persist CSV blob and structured rows in Postgres (CSV keeps the rest of the system unchanged)
-        storage.save_file(
+        # Blocking psycopg calls run off the event loop so concurrent requests keep flowing
+        await asyncio.to_thread(
+            storage.save_file,
             user_id=user_id,
             file_type="jobs_csv",
             content=normalized_csv,
             filename=f"jobs_{user_id}.csv",
             mime_type="text/csv",
         )
-        storage.replace_job_experiences(user_id, df.to_dict(orient="records"))
+        await asyncio.to_thread(storage.replace_job_experiences, user_id, df.to_dict(orient="records"))
         rows = len(df)
         logger.info("Parsed JSON jobs=%d; normalized and stored as CSV in database", rows)
 
@@ -128,10 +128,14 @@ async def upload_jobs(user_id: str, payload: JobUploadRequest):
         if rows == 0:
             logger.info("Jobs parsed but contains 0 rows; skipping ingest")
             return {"status": "ok", "rows_ingested": 0, "hash": new_hash}
-        df_ingest = df.fillna("")
-        docs = []
-        for _, row in df_ingest.iterrows():
-            docs.append("\n".join([f"{col}: {row[col]}" for col in df_ingest.columns]))
+        df_ingest = df.fillna("").astype(str)
+        # Column-wise concatenation instead of a per-row iterrows() loop
+        rendered = None
+        for col in df_ingest.columns:
+            part = f"{col}: " + df_ingest[col]
+            rendered = part if rendered is None else rendered + "\n" + part
+        # Same dedup as the CSV ingest paths, so ids line up with the bot's re-ingest check
+        docs = list(unique_documents(rendered.tolist()))
         ids = [f"{user_id}_{i}" for i in range(len(docs))]
         logger.info("Ingesting %d rows into pgvector for user=%s", len(docs), user_id)
         await store.aadd_documents(
@@ -1,11 +1,15 @@
+import asyncio
+import functools
 import os
 import time
 import logging
 import hmac
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse, StreamingResponse, FileResponse
 
-from api.config import OUTPUTS_BASE
+from api.config import OUTPUTS_BASE, RENDER_WORKERS
 from api.schemas import ResumeRequest
 from api.utils import (
     _validate_user_id,
@@ -15,7 +19,8 @@ from api.utils import (
     _hash_text,
     _build_result_signature,
     _build_request_signature,
-    _load_resume_cache,
+    _lookup_resume_cache,
+    _rendered_signature,
     _build_signed_files,
     clean_output_dir,
     _save_resume_cache,
@@ -34,6 +39,10 @@ from resume import LatexResumeWriter, WordResumeWriter
 logger = logging.getLogger("betterresume.api.resume")
 router = APIRouter()
 
+# File rendering (python-docx save, pdflatex/soffice subprocesses) is blocking;
+# running it here keeps the event loop free and lets requests render side by side.
+_RENDER_POOL = ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix="resume-render")
+
 SSE_HEADERS = {
     "Cache-Control": "no-cache",
     "Connection": "keep-alive",
@@ -43,6 +52,30 @@ SSE_HEADERS = {
 }
 
 
+def _start_prepare(writer) -> asyncio.Future:
+    """Run the writer's response-independent setup on the render pool while the model generates."""
+    return asyncio.get_running_loop().run_in_executor(_RENDER_POOL, writer.prepare)
+
+
+def _discard_prepare(prepared: asyncio.Future) -> None:
+    """Cancel a prepare that won't be rendered, or consume its outcome if it already ran."""
+    if not prepared.cancel() and not prepared.cancelled():
+        prepared.exception()
+
+
+async def _render(writer, result, output_name: str, prepared: Optional[asyncio.Future] = None):
+    """Write the resume source and PDF on the shared render pool."""
+    if prepared is not None:
+        try:
+            await prepared
+        except Exception:
+            logger.warning("Writer prepare failed; rendering from scratch", exc_info=True)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _RENDER_POOL, functools.partial(writer.write, result, output=output_name, to_pdf=True)
+    )
+
+
 def _record_generation(user_id, model, fmt, language, started_at, status, error=None):
     """Persist a generation event for admin statistics; never raises."""
     try:
@@ -124,11 +157,10 @@ async def generate_resume(user_id: str, req: ResumeRequest):
     signature = _build_request_signature(req, csv_hash, profile_hash, job_hash)
     out_dir = os.path.join(OUTPUTS_BASE, user_id)
     os.makedirs(out_dir, exist_ok=True)
-    cached = _load_resume_cache(out_dir) or {"results": {}, "renders": {}}
-    render_entry = cached.get("renders", {}).get(signature)
-    result_entry = cached.get("results", {}).get(result_signature)
-    cached_result = result_entry.get("result") if result_entry else None
-    files_from_cache = _build_signed_files(user_id, fmt, out_dir) if render_entry else {}
+    render_entry, cached_result = _lookup_resume_cache(out_dir, signature, result_signature)
+    # Only reuse the files on disk if they are this exact render (not just any cached one)
+    on_disk = render_entry is not None and _rendered_signature(out_dir) == signature
+    files_from_cache = _build_signed_files(user_id, fmt, out_dir) if on_disk else {}
 
     if render_entry and cached_result is not None and files_from_cache.get("source"):
         logger.info("Reusing cached resume output for user_id=%s format=%s", user_id, fmt)
@@ -141,7 +173,7 @@ async def generate_resume(user_id: str, req: ResumeRequest):
         output_name = os.path.join(out_dir, f"resume{writer.file_ending}")
         try:
             typed_result = _as_resume(cached_result)
-            writer.write(typed_result, output=output_name, to_pdf=True)
+            await _render(writer, typed_result, output_name)
         except Exception as exc:
             logger.exception("Failed rewriting resume from cache: %s", exc)
             raise HTTPException(status_code=500, detail="Failed to render cached resume")
@@ -153,30 +185,35 @@ async def generate_resume(user_id: str, req: ResumeRequest):
         return JSONResponse(content={"result": cached_result, "files": signed_files, "rows": row_count})
 
     writer = _make_writer(fmt, csv_path, profile_path)
-    store = get_user_store(user_id)
-    clean_output_dir(out_dir)
-    logger.info("Starting Bot generation; out_dir=%s", out_dir)
-    bot = Bot(user_id=user_id, vector_store=store, jobs_csv=csv_path)
-    gen_start = time.time()
+    prepared = _start_prepare(writer)
     try:
-        result = await bot.generate_resume(req.job_description)
-    except Exception as exc:
-        _record_generation(user_id, bot.model, fmt, None, gen_start, "error", str(exc))
-        raise
-    _record_generation(user_id, bot.model, fmt, result.language, gen_start, "success")
-    logger.info(
-        "Bot generation complete; language=%s skills=%d exp=%d",
-        result.language,
-        len(result.resume_section.skills),
-        len(result.resume_section.experience),
-    )
-    # Write files in API layer for consistency
-    output_name = os.path.join(out_dir, f"resume{writer.file_ending}")
-    try:
-        writer.write(result, output=output_name, to_pdf=True)
-    except Exception as exc:
-        logger.exception("Failed writing resume files: %s", exc)
-        raise HTTPException(status_code=500, detail="Failed to render resume")
+        store = get_user_store(user_id)
+        clean_output_dir(out_dir)
+        logger.info("Starting Bot generation; out_dir=%s", out_dir)
+        bot = Bot(user_id=user_id, vector_store=store, jobs_csv=csv_path)
+        gen_start = time.time()
+        try:
+            result = await bot.generate_resume(req.job_description)
+        except Exception as exc:
+            _record_generation(user_id, bot.model, fmt, None, gen_start, "error", str(exc))
+            raise
+        _record_generation(user_id, bot.model, fmt, result.language, gen_start, "success")
+        logger.info(
+            "Bot generation complete; language=%s skills=%d exp=%d",
+            result.language,
+            len(result.resume_section.skills),
+            len(result.resume_section.experience),
+        )
+        # Write files in API layer for consistency
+        output_name = os.path.join(out_dir, f"resume{writer.file_ending}")
+        try:
+            await _render(writer, result, output_name, prepared)
+        except Exception as exc:
+            logger.exception("Failed writing resume files: %s", exc)
+            raise HTTPException(status_code=500, detail="Failed to render resume")
+    finally:
+        # Still pending only when generation failed; don't leave it unawaited.
+        _discard_prepare(prepared)
     signed_files = _build_signed_files(user_id, fmt, out_dir)
     if signed_files.get("source"):
         _save_resume_cache(out_dir, _cache_payload(
@@ -206,11 +243,9 @@ async def generate_resume_stream(user_id: str, req: ResumeRequest):
     store = get_user_store(user_id)
     out_dir = os.path.join(OUTPUTS_BASE, user_id)
     os.makedirs(out_dir, exist_ok=True)
-    cached = _load_resume_cache(out_dir) or {"results": {}, "renders": {}}
-    render_entry = cached.get("renders", {}).get(signature)
-    result_entry = cached.get("results", {}).get(result_signature)
-    cached_files = _build_signed_files(user_id, fmt, out_dir) if render_entry else {}
-    cached_result = result_entry.get("result") if result_entry else None
+    render_entry, cached_result = _lookup_resume_cache(out_dir, signature, result_signature)
+    on_disk = render_entry is not None and _rendered_signature(out_dir) == signature
+    cached_files = _build_signed_files(user_id, fmt, out_dir) if on_disk else {}
 
     row_count = _count_csv_rows(csv_path)
     if not row_count:
@@ -255,7 +290,7 @@ async def generate_resume_stream(user_id: str, req: ResumeRequest):
             user_id, fmt, req.include_profile_picture,
         )
 
-        def cached_rerender_generator():
+        async def cached_rerender_generator():
             try:
                 yield sse_event(csv_info)
                 yield sse_event({"stage": "cached", "message": "Reusing cached resume content"})
@@ -264,7 +299,7 @@ async def generate_resume_stream(user_id: str, req: ResumeRequest):
                 output_name = os.path.join(out_dir, f"resume{writer.file_ending}")
                 try:
                     typed_result = _as_resume(cached_result)
-                    writer.write(typed_result, output=output_name, to_pdf=True)
+                    await _render(writer, typed_result, output_name)
                 except Exception as exc:
                     raise RuntimeError(f"Failed to render cached resume: {exc}")
                 files = _build_signed_files(user_id, fmt, out_dir)
@@ -291,6 +326,7 @@ async def generate_resume_stream(user_id: str, req: ResumeRequest):
 
     async def event_generator():
         gen_start = time.time()
+        prepared = _start_prepare(writer)
         try:
             yield sse_event(csv_info)
             async for event in bot.generate_resume_progress(req.job_description):
@@ -303,7 +339,7 @@ async def generate_resume_stream(user_id: str, req: ResumeRequest):
                             user_id, bot.model, fmt,
                             getattr(result_obj, "language", None), gen_start, "success",
                         )
-                        writer.write(result_obj, output=output_name, to_pdf=True)
+                        await _render(writer, result_obj, output_name, prepared)
                         files = _build_signed_files(user_id, fmt, out_dir)
                         event["files"] = files
                         event["result"] = _serialize_result(result_obj)
@@ -321,6 +357,8 @@ async def generate_resume_stream(user_id: str, req: ResumeRequest):
             logger.exception("Streaming generation failed")
             _record_generation(user_id, bot.model, fmt, None, gen_start, "error", str(e))
             yield sse_event({"stage": "error", "message": str(e)})
+        finally:
+            _discard_prepare(prepared)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream", headers=SSE_HEADERS)
 
@@ -22,4 +22,10 @@ async def clear_user(user_id: str):
         await store.adelete_user_documents(user_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete user documents: {e}")
+    finally:
+        # No longer in USER_STORES, so the lifespan shutdown won't release its HTTP client
+        try:
+            await store.aclose()
+        except Exception:
+            pass
     return {"status": "deleted", "user_id": user_id}
@@ -4,3 +4,6 @@ from llm.vector_store import PGVectorStore
 
 # Maintain a cache of user_id -> PGVectorStore (separate per-user stores)
 USER_STORES: Dict[str, PGVectorStore] = {}
+
+# Per-process hit/miss counters for the per-user resume result cache
+RESUME_CACHE_STATS: Dict[str, int] = {"hits": 0, "misses": 0}
@@ -4,28 +4,36 @@ import hmac
 import hashlib
 import json
 import re
+import orjson
 import shutil
 import logging
 import tempfile
 from hashlib import sha256
-from typing import Optional, Dict
+from typing import Any, Dict, Optional, Tuple
 from fastapi import HTTPException, UploadFile
 
 from api.config import (
     DOWNLOAD_SIGNING_SECRET,
     CACHE_FILENAME,
+    RENDER_SIGNATURE_FILENAME,
+    RESUME_CACHE_MAX_RESULTS,
     PROFILE_PICS_BASE,
     PROFILE_EXTENSIONS,
     ALLOWED_PROFILE_IMAGE_TYPES,
     OUTPUTS_BASE
 )
-from api.state import USER_STORES
+from api.state import RESUME_CACHE_STATS, USER_STORES
 from llm import agent
 from llm.vector_store import PGVectorStore
 from utils.db_storage import DBStorage
 
 logger = logging.getLogger("betterresume.api.utils")
 
+# Prompt edits change what the model produces, so they must invalidate cached results.
+_PROMPT_VERSION = hashlib.sha256(
+    (agent.JOB_PROMPT + "\0" + agent.TRANSLATION_PROMPT).encode("utf-8")
+).hexdigest()[:16]
+
 def _hmac_sign(user_id: str, filename: str, exp: int) -> str:
     """Create an HMAC signature for a given user/file/expiry tuple."""
     message = f"{user_id}:{filename}:{exp}".encode("utf-8")
@@ -109,12 +117,21 @@ def _load_resume_cache(out_dir: str) -> Optional[dict]:
     if not os.path.isfile(cache_path):
         return None
     try:
-        with open(cache_path, "r", encoding="utf-8") as fh:
-            return _normalize_resume_cache(json.load(fh))
+        with open(cache_path, "rb") as fh:
+            return _normalize_resume_cache(orjson.loads(fh.read()))
     except Exception:
         logger.warning("Unable to read resume cache at %s", cache_path, exc_info=True)
         return None
 
+def _lookup_resume_cache(out_dir: str, signature: str, result_signature: str) -> Tuple[Optional[dict], Optional[Any]]:
+    """Return (render entry, cached result) for a request and count the hit or miss."""
+    cached = _load_resume_cache(out_dir) or {"results": {}, "renders": {}}
+    render_entry = cached.get("renders", {}).get(signature)
+    result_entry = cached.get("results", {}).get(result_signature)
+    cached_result = result_entry.get("result") if result_entry else None
+    RESUME_CACHE_STATS["hits" if cached_result is not None else "misses"] += 1
+    return render_entry, cached_result
+
 def _save_resume_cache(out_dir: str, payload: dict) -> None:
     cache_path = os.path.join(out_dir, CACHE_FILENAME)
     tmp_path = cache_path + ".tmp"
@@ -132,6 +149,7 @@ def _save_resume_cache(out_dir: str, payload: dict) -> None:
             "job_description_hash": payload.get("job_description_hash"),
             "generated_at": generated_at,
         }
+        _evict_old_results(existing)
 
     if render_signature and result_signature:
         existing.setdefault("renders", {})[render_signature] = {
@@ -157,8 +175,8 @@ def _save_resume_cache(out_dir: str, payload: dict) -> None:
         }
     )
     try:
-        with open(tmp_path, "w", encoding="utf-8") as fh:
-            json.dump(existing, fh, ensure_ascii=False)
+        with open(tmp_path, "wb") as fh:
+            fh.write(orjson.dumps(existing))
         os.replace(tmp_path, cache_path)
     except Exception:
         logger.warning("Unable to persist resume cache to %s", cache_path, exc_info=True)
@@ -167,6 +185,33 @@ def _save_resume_cache(out_dir: str, payload: dict) -> None:
                 os.remove(tmp_path)
         except Exception:
             pass
+    # Saved right after a successful render, so the files on disk are this render
+    if render_signature:
+        try:
+            with open(os.path.join(out_dir, RENDER_SIGNATURE_FILENAME), "w", encoding="utf-8") as fh:
+                fh.write(render_signature)
+        except Exception:
+            logger.warning("Unable to write render signature in %s", out_dir, exc_info=True)
+
+def _rendered_signature(out_dir: str) -> Optional[str]:
+    """Render signature of the files currently in out_dir, or None if unknown."""
+    try:
+        with open(os.path.join(out_dir, RENDER_SIGNATURE_FILENAME), "r", encoding="utf-8") as fh:
+            return fh.read().strip() or None
+    except OSError:
+        return None
+
+def _evict_old_results(cache: dict) -> None:
+    """Keep only the newest RESUME_CACHE_MAX_RESULTS results and the renders pointing at them."""
+    results = cache.get("results", {})
+    if len(results) <= RESUME_CACHE_MAX_RESULTS:
+        return
+    by_age = sorted(results, key=lambda sig: results[sig].get("generated_at") or 0, reverse=True)
+    for sig in by_age[RESUME_CACHE_MAX_RESULTS:]:
+        del results[sig]
+    renders = cache.get("renders", {})
+    for sig in [s for s, entry in renders.items() if entry.get("result_signature") not in results]:
+        del renders[sig]
 
 def _hash_text(value: Optional[str]) -> str:
     return hashlib.sha256((value or "").encode("utf-8")).hexdigest()
@@ -176,6 +221,7 @@ def _build_result_signature(req, csv_hash: Optional[str], job_hash: str) -> str:
         "job_description_hash": job_hash,
         "model": agent.DEFAULT_MODEL,
         "csv_hash": csv_hash,
+        "prompt_version": _PROMPT_VERSION,
     }
     serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
     return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
@@ -231,12 +277,18 @@ def _resolve_profile_picture_path(user_id: str) -> Optional[str]:
     return None
 
 def clean_output_dir(path: str):
-    """Remove all existing files in the user's output directory."""
+    """Remove the previous render from the user's output directory.
+
+    The resume cache file is kept so results cached for other job descriptions
+    stay reusable; the render signature sidecar goes with the files it describes.
+    """
     try:
         if not os.path.isdir(path):
             os.makedirs(path, exist_ok=True)
             return
         for name in os.listdir(path):
+            if name == CACHE_FILENAME:
+                continue
             full = os.path.join(path, name)
             try:
                 if os.path.isfile(full) or os.path.islink(full):
@@ -280,5 +332,4 @@ def _detect_profile_extension(file: UploadFile) -> Optional[str]:
     return None
 
 def sse_event(data: dict) -> bytes:
-    import json as _json
-    return f"data: {_json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+    return b"data: " + orjson.dumps(data) + b"\n\n"
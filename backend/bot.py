@@ -2,14 +2,15 @@
 
 `Bot` drives the full pipeline around the module-level pydantic-ai agents in
 `llm.agent`: CSV ingest into the vector store, authoritative context building,
-generation, stored-language injection, education merge and translation.
+generation, stored-language injection, education merge and optional translation.
 File rendering is the API layer's responsibility.
 """
 
 import asyncio
 import logging
 import os
-from typing import Any, AsyncIterator, Optional, Union
+from datetime import date
+from typing import Any, AsyncIterator, List, Optional, Union
 
 from llm import agent
 from models.education import Education
@@ -17,7 +18,7 @@ from models.language import Language
 from models.resume import ResumeOutputFormat
 from utils.db_storage import DBStorage
 from utils.generation_context import build_generation_context, extract_languages, format_display_date
-from utils.ingest import load_csv_documents
+from utils.ingest import load_csv_documents, unique_documents
 from utils.logging_utils import set_user_context
 
 
@@ -32,6 +33,7 @@ class Bot:
         db: Any = None,
         auto_ingest: bool = True,
         jobs_csv: str = "jobs.csv",
+        translate_pass: bool = False,
     ):
         """Initialize Bot.
 
@@ -42,6 +44,9 @@ class Bot:
             db: Optional DB handle passed to the agent tools (defaults to DBStorage).
             auto_ingest: If True, loads jobs_csv into the store (if file exists).
             jobs_csv: Path to CSV to ingest.
+            translate_pass: If True, run non-English resumes through the translation
+                agent afterwards. Off by default: the generation prompt already writes
+                the resume in the job description's language, saving a full LLM pass.
         """
         if not user_id:
             raise ValueError("user_id is required to generate a resume")
@@ -49,6 +54,7 @@ class Bot:
         self.vector_store = vector_store
         self.model = agent.normalize_model_name(model)
         self.db = db
+        self.translate_pass = translate_pass
         self.logger = logging.getLogger("betterresume.bot")
         self.logger.info(
             "Bot init model=%s has_store=%s auto_ingest=%s jobs_csv=%s user=%s",
@@ -71,22 +77,45 @@ class Bot:
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
-            # No running loop; run to completion.
-            asyncio.run(self._auto_ingest_jobs(jobs_csv))
+            # No running loop; run to completion, closing the store's HTTP client before the loop ends.
+            async def run():
+                try:
+                    await self._auto_ingest_jobs(jobs_csv)
+                finally:
+                    close = getattr(self.vector_store, "aclose", None)
+                    if close is not None:
+                        await close()
+
+            asyncio.run(run())
             return
         # Running loop; schedule background task.
         self._auto_ingest_task = loop.create_task(self._auto_ingest_jobs(jobs_csv))
 
+    async def _stored_documents_match(self, ids: list, docs: list) -> bool:
+        """True when the store already holds exactly these documents for the user."""
+        getter = getattr(self.vector_store, "aget_user_documents", None)
+        if getter is None:
+            return False
+        try:
+            existing = await getter(self.user_id)
+        except Exception:
+            return False
+        return bool(existing) and existing == dict(zip(ids, docs))
+
     async def _auto_ingest_jobs(self, jobs_csv: str):
         try:
+            docs = list(unique_documents(load_csv_documents(jobs_csv)))
+            ids = [f"{self.user_id}_{i}" for i in range(len(docs))]
+            if await self._stored_documents_match(ids, docs):
+                self.logger.info("Stored vectors already match %s; skipping ingest user=%s", jobs_csv, self.user_id)
+                return
+
             self.logger.info("Resetting pgvector rows for fresh ingest user=%s", self.user_id)
             try:
                 await self.vector_store.adelete_user_documents(self.user_id)
             except Exception:
                 pass
 
-            docs = load_csv_documents(jobs_csv)
-            ids = [f"{self.user_id}_{i}" for i in range(len(docs))]
             self.logger.info("Auto-ingesting %d rows from %s for user=%s", len(docs), jobs_csv, self.user_id)
             await self.vector_store.aadd_documents(docs, ids, user_id=self.user_id)
         except Exception as e:
@@ -96,49 +125,71 @@ class Bot:
     # Stored-data helpers
     # ------------------------------------------------------------------
 
-    def _fetch_generation_context(self) -> Optional[str]:
+    def _fetch_stored_records(self) -> Optional[list]:
+        """All of the user's stored records in one query. The context block, the
+        language fallback and the education merge are all derived from this list,
+        so a generation costs one DB round trip instead of three."""
+        try:
+            records = DBStorage().get_job_experiences(self.user_id)
+            self.logger.info("Fetched %d stored records for user=%s", len(records), self.user_id)
+            return records
+        except Exception as e:
+            self.logger.warning("Could not fetch stored records: %s", e)
+            return None
+
+    def _build_generation_context(self, records: Optional[list]) -> Optional[str]:
         """Build the authoritative context block (current date, computed years of
         experience, spoken languages) from the user's stored records."""
+        if records is None:
+            return None
         try:
-            records = DBStorage().get_job_experiences(self.user_id)
-            context = build_generation_context(records)
-            self.logger.info("Generation context built from %d stored records", len(records))
-            return context
+            return build_generation_context(records)
         except Exception as e:
             self.logger.warning("Could not build generation context: %s", e)
             return None
 
-    def _fetch_stored_languages(self, storage: DBStorage) -> list:
-        records = storage.get_job_experiences(self.user_id, type_filter="language")
+    @staticmethod
+    def _is_english(resume: ResumeOutputFormat) -> bool:
+        return (resume.language or "").lower() == "en"
+
+    @staticmethod
+    def _stored_languages(records: list) -> list:
         return [
             Language(name=name, proficiency=proficiency)
             for name, proficiency in extract_languages(records)
         ]
 
-    def _inject_stored_languages(self, resume: ResumeOutputFormat) -> None:
+    def _inject_stored_languages(self, resume: ResumeOutputFormat, records: Optional[list]) -> None:
         """Fallback: if the model omitted the languages section despite the context
         block, fill it from stored data. When the model did produce languages we keep
         its output — it writes the names and proficiency levels in the resume's
-        language, which raw DB values are not guaranteed to be in."""
-        if resume.resume_section.languages:
+        language, which raw DB values are not guaranteed to be in.
+
+        Stored values are not localized, so they are only injected into English
+        resumes or when the translation pass will localize them afterwards."""
+        if resume.resume_section.languages or not records:
+            return
+        if not (self._is_english(resume) or self.translate_pass):
+            self.logger.info("Model omitted languages; not injecting untranslated stored ones (language=%s)", resume.language)
             return
         try:
-            stored_languages = self._fetch_stored_languages(DBStorage())
+            stored_languages = self._stored_languages(records)
             if stored_languages:
                 resume.resume_section.languages = stored_languages
                 self.logger.info("Injected %d stored languages (model omitted them)", len(stored_languages))
         except Exception as e:
             self.logger.warning("Could not inject stored languages: %s", e)
 
-    def _fetch_education(self) -> list:
+    def _education_from_records(self, records: Optional[list]) -> list:
         """Map stored education records (DB schema) onto the resume Education model."""
-        records = DBStorage().get_job_experiences(self.user_id, type_filter="education")
-        self.logger.info("Fetched %d education records for user=%s", len(records), self.user_id)
+        records = [r for r in records or [] if str(r.get("type", "")).strip().lower() == "education"]
+        self.logger.info("Merging %d education records for user=%s", len(records), self.user_id)
         education_list = []
+        today = date.today()
         for rec in records:
             # DB: type, company, description, role, location, start_date, end_date
             # Model: institution, degree, dates
-            date_parts = [format_display_date(rec.get("start_date")), format_display_date(rec.get("end_date"))]
+            date_parts = [format_display_date(rec.get(key), today) for key in ("start_date", "end_date")]
             education_list.append(Education(
                 institution=rec.get("company") or "",
                 degree=(rec.get("description") or "") or (rec.get("role") or ""),
@@ -150,16 +201,13 @@ class Bot:
     # Generation pipeline
     # ------------------------------------------------------------------
 
-    async def _pipeline(self, jd: str, merge_education: bool) -> AsyncIterator[dict]:
-        """Single generation pipeline; both public entry points consume this."""
-        if self._auto_ingest_task:
-            await self._auto_ingest_task
-        set_user_context(self.user_id)
+    async def _generate_streaming(self, jd: str, extra_context: Optional[str]) -> AsyncIterator[dict]:
+        """Run the generation agent, yielding its progress events as they stream in.
 
-        self.logger.info("Generate resume start; jd_chars=%d", len(jd or ""))
-        yield {"stage": "invoking_llm", "message": "Invoking LLM"}
-        extra_context = self._fetch_generation_context()
-        resume = await agent.generate(
+        The final event carries the resume under ``result`` (stage ``generated``).
+        """
+        events: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(agent.generate(
             jd,
             user_id=self.user_id,
             vector_store=self.vector_store,
@@ -167,19 +215,62 @@ class Bot:
             model=self.model,
             require_tool_call=True,
             extra_context=extra_context,
-        )
+            on_event=events.put_nowait,
+        ))
+        try:
+            while not task.done():
+                getter = asyncio.ensure_future(events.get())
+                await asyncio.wait({task, getter}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield getter.result()
+                else:
+                    getter.cancel()
+            while not events.empty():
+                yield events.get_nowait()
+            yield {"stage": "generated", "result": task.result()}
+        finally:
+            if not task.done():
+                task.cancel()
+
+    async def _pipeline(self, jd: str, merge_education: bool, stream_events: bool = False) -> AsyncIterator[dict]:
+        """Single generation pipeline; both public entry points consume this."""
+        if self._auto_ingest_task:
+            await self._auto_ingest_task
+        set_user_context(self.user_id)
+
+        self.logger.info("Generate resume start; jd_chars=%d", len(jd or ""))
+        yield {"stage": "invoking_llm", "message": "Invoking LLM"}
+        records = await asyncio.to_thread(self._fetch_stored_records)
+        extra_context = self._build_generation_context(records)
+        if stream_events:
+            resume = None
+            async for event in self._generate_streaming(jd, extra_context):
+                if event["stage"] == "generated":
+                    resume = event["result"]
+                else:
+                    yield event
+        else:
+            resume = await agent.generate(
+                jd,
+                user_id=self.user_id,
+                vector_store=self.vector_store,
+                db=self.db,
+                model=self.model,
+                require_tool_call=True,
+                extra_context=extra_context,
+            )
         self.logger.info("Agent returned resume; language=%s", resume.language)
-        self._inject_stored_languages(resume)
+        self._inject_stored_languages(resume, records)
         yield {"stage": "parsed", "message": "Initial resume parsed", "data": {"language": resume.language}}
 
-        if (resume.language or "").lower() != "en":
+        if self.translate_pass and not self._is_english(resume):
             yield {"stage": "translating", "message": "Translating resume"}
             resume = await self.translate_resume(resume, jd)
             self.logger.info("Translation applied; language=%s", resume.language)
             yield {"stage": "translated", "message": "Translation complete", "data": {"language": resume.language}}
 
         if merge_education:
-            resume.resume_section.education = self._fetch_education()
+            resume.resume_section.education = self._education_from_records(records)
 
         yield {"stage": "done", "message": "Resume generation complete", "result": resume}
 
@@ -190,9 +281,13 @@ class Bot:
                 resume = event["result"]
         return resume
 
+    async def generate_resumes_batch(self, jds: List[str]) -> List[ResumeOutputFormat]:
+        """Generate one resume per job description concurrently, preserving input order."""
+        return list(await asyncio.gather(*(self.generate_resume(jd) for jd in jds)))
+
     async def generate_resume_progress(self, jd: str) -> AsyncIterator[dict]:
         """Async generator yielding progress events; leaves file creation to API layer."""
-        async for event in self._pipeline(jd, merge_education=True):
+        async for event in self._pipeline(jd, merge_education=True, stream_events=True):
             yield event
 
     async def translate_resume(self, r: ResumeOutputFormat, original_jd: str) -> ResumeOutputFormat:
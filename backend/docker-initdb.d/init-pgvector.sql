@@ -9,9 +9,12 @@ CREATE TABLE IF NOT EXISTS resume_vectors (
   embedding vector(768)
 );
 
--- IVFFLAT index for ANN search. Tune lists for your dataset; 100 is a reasonable start.
-CREATE INDEX IF NOT EXISTS idx_resume_vectors_embedding
-ON resume_vectors USING ivfflat (embedding) WITH (lists = 100);
+-- Per-user lookups (exact search, deletes, counts)
+CREATE INDEX IF NOT EXISTS idx_resume_vectors_user_id ON resume_vectors (user_id);
+
+-- HNSW index for ANN search (matches DBStorage.init_schema; tune via PGVECTOR_HNSW_* env vars).
+CREATE INDEX IF NOT EXISTS idx_resume_vectors_embedding_hnsw
+ON resume_vectors USING hnsw (embedding vector_l2_ops) WITH (m = 24, ef_construction = 128);
 
 -- Users table
 CREATE TABLE IF NOT EXISTS users (
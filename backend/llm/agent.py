@@ -13,15 +13,17 @@ asked to retry and call `search_experience` first.
 """
 
 import asyncio
+import functools
 import logging
 import os
 import time
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, AsyncIterable, Callable, List, Optional, Tuple, Union
 
-from pydantic_ai import Agent, ModelRetry, RunContext
-from pydantic_ai.models import Model
+from pydantic_ai import Agent, ModelRetry, RunContext, ToolOutput
+from pydantic_ai.messages import AgentStreamEvent, FinalResultEvent, FunctionToolCallEvent
+from pydantic_ai.models import Model, infer_model
 
 from models.resume import ResumeOutputFormat
 from utils.file_io import load_prompt
@@ -32,6 +34,8 @@ logger = logging.getLogger("betterresume.agent")
 # e.g. "openrouter:wafer/fp4" or "google:gemini-2.5-flash-lite").
 DEFAULT_MODEL = os.environ.get("DEFAULT_MODEL", "openrouter:wafer/fp4")
 RETRIES = 3
+# Upper bound on search_experience's n_results; larger k mostly adds prompt tokens.
+MAX_SEARCH_RESULTS = 50
 
 JOB_PROMPT = load_prompt("job_prompt")
 TRANSLATION_PROMPT = load_prompt("translation_prompt")
@@ -61,8 +65,37 @@ def normalize_model_name(model: Union[str, Model, None]) -> Union[str, Model]:
     return model
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_model_name(name: str) -> Model:
+    return infer_model(name)
+
+
+def resolve_model(model: Union[str, Model, None]) -> Model:
+    """Return one shared `Model` per model name.
+
+    Passing a bare name to `Agent.run` builds a new provider, and with it a new
+    HTTP client, on every run. Reusing the instance keeps its connection pool
+    (and TLS sessions) across requests while the model stays entered; see
+    `api.main.lifespan`. Model instances are passed through unchanged.
+    """
+    model = normalize_model_name(model)
+    if isinstance(model, str):
+        return _resolve_model_name(model)
+    return model
+
+
+@functools.lru_cache(maxsize=1)
+def _openrouter_settings() -> dict:
+    """Built once per process; pydantic-ai merges run settings into a new dict, so
+    sharing the instance across runs is safe."""
+    from pydantic_ai.models.openrouter import OpenRouterModelSettings
+
+    return OpenRouterModelSettings(openrouter_reasoning={"enabled": False}, parallel_tool_calls=True)
+
+
 def _model_settings(model: Union[str, Model]) -> Optional[dict]:
-    """Per-model run settings. For OpenRouter, disable reasoning tokens to cut latency.
+    """Per-model run settings. For OpenRouter, disable reasoning tokens to cut latency
+    and allow parallel tool calls so the searches land in one turn.
 
     Returns ``None`` for non-OpenRouter models so their defaults are untouched.
     """
@@ -72,9 +105,55 @@ def _model_settings(model: Union[str, Model]) -> Optional[dict]:
         is_openrouter = type(model).__name__ == "OpenRouterModel"
     if not is_openrouter:
         return None
-    from pydantic_ai.models.openrouter import OpenRouterModelSettings
+    return _openrouter_settings()
+
+
+class _SearchBatcher:
+    """Coalesces the search_experience calls of one model turn into a single store query.
+
+    pydantic-ai starts every tool call of a response as its own task; each call
+    parks its query here and the first one schedules a flush for the next loop
+    iteration, by which point its siblings have queued too. Stores without
+    `aquery_many` fall back to one `aquery` per call.
+    """
 
-    return OpenRouterModelSettings(openrouter_reasoning={"enabled": False})
+    def __init__(self, store: Any, user_id: str):
+        self._store = store
+        self._user_id = user_id
+        self._pending: List[Tuple[str, int, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def query(self, query: str, n_results: int) -> Any:
+        if not hasattr(self._store, "aquery_many"):
+            return await self._store.aquery(query, self._user_id, n_results=n_results)
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        if not self._pending:
+            loop.call_soon(self._schedule_flush)
+        self._pending.append((query, n_results, fut))
+        return await fut
+
+    def _schedule_flush(self) -> None:
+        self._flush_task = asyncio.ensure_future(self._flush())
+
+    async def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        groups: dict = {}
+        for item in pending:
+            groups.setdefault(item[1], []).append(item)
+        for n_results, items in groups.items():
+            try:
+                results = await self._store.aquery_many([q for q, _, _ in items], self._user_id, n_results=n_results)
+            except Exception as e:
+                for _, _, fut in items:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+            if len(items) > 1:
+                logger.info("search_experience batched %d queries user=%s", len(items), self._user_id)
+            for (_, _, fut), result in zip(items, results):
+                if not fut.done():
+                    fut.set_result(result)
 
 
 @dataclass
@@ -87,17 +166,22 @@ class ResumeDeps:
     require_tool_call: bool = False
     search_calls: int = 0
     tool_events: List[dict] = field(default_factory=list)
+    search_batcher: Optional[_SearchBatcher] = field(default=None, repr=False)
 
 
+# Strict output tool: OpenAI-compatible providers (incl. OpenRouter) grammar-constrain
+# the resume arguments to the schema, so malformed JSON never costs a retry round.
+RESUME_OUTPUT = ToolOutput(ResumeOutputFormat, strict=True)
+
 generation_agent = Agent(
     deps_type=ResumeDeps,
-    output_type=ResumeOutputFormat,
+    output_type=RESUME_OUTPUT,
     instructions=JOB_PROMPT,
     retries=RETRIES,
 )
 
 translation_agent = Agent(
-    output_type=ResumeOutputFormat,
+    output_type=RESUME_OUTPUT,
     instructions=TRANSLATION_PROMPT,
     retries=RETRIES,
 )
@@ -127,15 +211,18 @@ async def search_experience(ctx: RunContext[ResumeDeps], query: str, n_results:
             sentences or verbatim job-description requirements — verbose,
             hyper-specific text retrieves poorly. Use separate calls for
             related terms instead of combining them.
-        n_results: Maximum number of matching documents to return.
+        n_results: Maximum number of matching documents to return (at most 50).
     """
     ctx.deps.search_calls += 1
     ctx.deps.tool_events.append({"tool": "search_experience", "query": query})
+    n_results = max(1, min(n_results, MAX_SEARCH_RESULTS))
     store = ctx.deps.vector_store
     if store is None:
         logger.warning("search_experience called without a vector store user=%s", ctx.deps.user_id)
         return []
-    results = await store.aquery(query, ctx.deps.user_id, n_results=n_results)
+    if ctx.deps.search_batcher is None:
+        ctx.deps.search_batcher = _SearchBatcher(store, ctx.deps.user_id)
+    results = await ctx.deps.search_batcher.query(query, n_results)
     logger.info(
         "search_experience user=%s query=%r results=%s",
         ctx.deps.user_id, query, len(results) if isinstance(results, list) else results,
@@ -195,6 +282,20 @@ def _log_usage(label: str, result) -> None:
         logger.debug("%s complete; usage unavailable", label)
 
 
+def _progress_handler(on_event: Callable[[dict], Any]):
+    """Adapt pydantic-ai stream events into the Bot's progress-event dicts."""
+
+    async def handler(ctx: RunContext[ResumeDeps], events: AsyncIterable[AgentStreamEvent]) -> None:
+        async for event in events:
+            if isinstance(event, FunctionToolCallEvent) and event.part.tool_name == "search_experience":
+                query = event.part.args_as_dict().get("query")
+                on_event({"stage": "searching", "message": f"Searching experience: {query}", "data": {"query": query}})
+            elif isinstance(event, FinalResultEvent):
+                on_event({"stage": "writing", "message": "Writing resume"})
+
+    return handler
+
+
 async def generate(
     jd: str,
     *,
@@ -204,6 +305,7 @@ async def generate(
     model: Union[str, Model, None] = None,
     require_tool_call: bool = True,
     extra_context: Optional[str] = None,
+    on_event: Optional[Callable[[dict], Any]] = None,
 ) -> ResumeOutputFormat:
     """Generate a structured resume for a job description.
 
@@ -211,6 +313,8 @@ async def generate(
         extra_context: Authoritative facts (current date, computed years of
             experience, spoken languages) appended to the prompt so the model
             stays consistent with the user's stored data.
+        on_event: Optional callback receiving progress-event dicts while the run
+            streams (searches issued, resume output started).
     """
     model = normalize_model_name(model)
     deps = ResumeDeps(
@@ -223,7 +327,11 @@ async def generate(
     logger.info("Generation start user=%s model=%s jd_chars=%d", user_id, model, len(jd or ""))
     prompt = jd if not extra_context else f"{jd}\n\n{extra_context}"
     result = await generation_agent.run(
-        prompt, model=model, deps=deps, model_settings=_model_settings(model)
+        prompt,
+        model=resolve_model(model),
+        deps=deps,
+        model_settings=_model_settings(model),
+        event_stream_handler=_progress_handler(on_event) if on_event else None,
     )
     logger.info(
         "Generation finished user=%s in %dms; searches=%d",
@@ -248,7 +356,7 @@ async def translate(
     )
     logger.info("Translation start user=%s language=%s", user_id, resume.language)
     result = await translation_agent.run(
-        prompt, model=model, model_settings=_model_settings(model)
+        prompt, model=resolve_model(model), model_settings=_model_settings(model)
     )
     _log_usage("Translation", result)
     return result.output
@@ -1,9 +1,19 @@
+import asyncio
 import logging
 import os
 from typing import List, Optional
 
 import httpx
 
+# Characters of a stored document that are embedded; keeps inputs under the
+# embedding model's 512-token limit.
+EMBEDDING_MAX_CHARS = 500
+
+
+def embedding_inputs(documents: List[str]) -> List[str]:
+    """The text of each document that gets embedded when it is stored."""
+    return [doc[:EMBEDDING_MAX_CHARS] for doc in documents]
+
 
 class EmbeddingClient:
     """Minimal async client for an OpenAI-compatible embeddings endpoint (HuggingFace TEI).
@@ -17,31 +27,85 @@ class EmbeddingClient:
         model: str = "sentence-transformers/all-mpnet-base-v2",
         chunk_size: int = 8,
         timeout: float = 30.0,
+        max_concurrency: int = 4,
         transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         self.base_url = (base_url or os.getenv("EMBEDDING_SERVICE_URL", "http://embedding-service-br:80/v1")).rstrip("/")
         self.model = model
         self.chunk_size = max(1, chunk_size)
         self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
         self._transport = transport
         self._logger = logging.getLogger("betterresume.embeddings")
+        self._http: Optional[httpx.AsyncClient] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def _client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout, transport=self._transport)
+        """Keep-alive client reused across calls, so each query doesn't pay a new TCP handshake.
+
+        httpx pools are bound to the event loop that created them, so a new client is
+        made if the sync wrappers (asyncio.run) call in from a different loop; the old
+        one is closed first so its connections don't leak.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http is not None and self._http_loop is not loop:
+            self._drop_foreign_client()
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                transport=self._transport,
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            )
+            self._http_loop = loop
+        return self._http
+
+    def _drop_foreign_client(self) -> None:
+        """Forget a client owned by another loop, closing it on that loop if it still runs."""
+        stale, stale_loop = self._http, self._http_loop
+        self._http = None
+        self._http_loop = None
+        if stale is None or stale.is_closed:
+            return
+        if stale_loop is not None and stale_loop.is_running():
+            asyncio.run_coroutine_threadsafe(stale.aclose(), stale_loop)
+        else:
+            # Its loop has already finished, so the sockets can no longer be shut down cleanly.
+            self._logger.warning("Discarding embedding HTTP client left open by a finished event loop")
+
+    async def aclose(self) -> None:
+        if self._http is not None and self._http_loop is not asyncio.get_running_loop():
+            self._drop_foreign_client()
+            return
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+        self._http_loop = None
 
     async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
-        """Embed a batch of documents, chunked to respect service limits."""
-        embeddings: List[List[float]] = []
-        async with self._client() as client:
-            for start in range(0, len(texts), self.chunk_size):
-                batch = texts[start:start + self.chunk_size]
+        """Embed a batch of documents, chunked to respect service limits.
+
+        Chunks are sent concurrently (up to ``max_concurrency`` in flight) so the
+        embedding service can batch them together instead of idling between requests.
+        """
+        client = self._client()
+        limiter = asyncio.Semaphore(self.max_concurrency)
+
+        async def embed_chunk(batch: List[str]) -> List[List[float]]:
+            async with limiter:
                 resp = await client.post("/embeddings", json={"model": self.model, "input": batch})
-                resp.raise_for_status()
-                data = resp.json()["data"]
-                # OpenAI-compatible APIs return items with an "index" field; keep order stable
-                data.sort(key=lambda item: item.get("index", 0))
-                embeddings.extend(item["embedding"] for item in data)
-        self._logger.debug("Embedded %d documents", len(texts))
+            resp.raise_for_status()
+            data = resp.json()["data"]
+            # OpenAI-compatible APIs return items with an "index" field; keep order stable
+            data.sort(key=lambda item: item.get("index", 0))
+            return [item["embedding"] for item in data]
+
+        chunks = await asyncio.gather(*(
+            embed_chunk(texts[start:start + self.chunk_size])
+            for start in range(0, len(texts), self.chunk_size)
+        ))
+        embeddings = [emb for chunk in chunks for emb in chunk]
+        self._logger.debug("Embedded %d documents in %d requests", len(texts), len(chunks))
         return embeddings
 
     async def aembed_query(self, text: str) -> List[float]:
@@ -1,12 +1,16 @@
 import asyncio
 import logging
 import os
-from typing import List, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from pgvector import Vector
 
-from llm.embeddings import EmbeddingClient
-from utils.db_storage import get_async_pool
+from llm.embeddings import EmbeddingClient, embedding_inputs
+from utils.db_storage import _resolve_db_url, get_async_pool
+
+_UPSERT_CHUNK = 500
+_QUERY_CACHE_SIZE = 256
 
 
 class PGVectorStore:
@@ -23,59 +27,144 @@ class PGVectorStore:
         dim: int = 768,
         user_id: Optional[str] = None,
         embeddings: Optional[EmbeddingClient] = None,
+        exact_search: bool = True,
     ):
         self._logger = logging.getLogger("betterresume.pgvector")
-        self.db_url = os.getenv("DATABASE_URL", db_url)
-        if self.db_url and self.db_url.startswith("postgresql+asyncpg://"):
-            self.db_url = self.db_url.replace("postgresql+asyncpg://", "postgresql://")
+        self.db_url = _resolve_db_url(os.getenv("DATABASE_URL", db_url))
         self.table_name = table_name
         self.dim = dim
         self.user_id = user_id
         self._emb = embeddings or EmbeddingClient(chunk_size=8)
+        # Each user owns a few dozen rows, so an exact scan of just their rows (via the
+        # user_id index) beats walking the shared HNSW graph and post-filtering by user,
+        # which can also return fewer than n_results matches.
+        self.exact_search = exact_search
+        # Last-read {id: content} per user. The API keeps one store per user for the
+        # process lifetime while a Bot is built per request, so this lets every Bot after
+        # the first skip the ingest check round trip. Writes through this store drop it.
+        self._documents_cache: Dict[str, Dict[str, str]] = {}
+        # Per-user LRU of search results. The model often repeats a query within one
+        # generation and across regenerations; a hit skips the embedding call and the scan.
+        self._query_cache: Dict[str, "OrderedDict[Tuple[str, int], List[Tuple[str, float]]]"] = {}
+        # Per-user write counter. A read only caches its result if no write started or
+        # finished while it was in flight, so it can't store pre-write rows after the write.
+        self._write_generation: Dict[str, int] = {}
+
+    async def aclose(self):
+        """Release the embedding client's pooled HTTP connections."""
+        await self._emb.aclose()
+
+    async def _closing(self, coro):
+        try:
+            return await coro
+        finally:
+            await self.aclose()
+
+    def _invalidate(self, user_id: str) -> None:
+        """Drop the user's caches; called both before and after every write."""
+        self._write_generation[user_id] = self._write_generation.get(user_id, 0) + 1
+        self._documents_cache.pop(user_id, None)
+        self._query_cache.pop(user_id, None)
+
+    def _generation(self, user_id: str) -> int:
+        return self._write_generation.get(user_id, 0)
+
+    @staticmethod
+    def _query_key(query: str, n_results: int) -> Tuple[str, int]:
+        return " ".join(query.lower().split()), n_results
+
+    def _cached_results(self, user_id: str, key: Tuple[str, int]) -> Optional[List[Tuple[str, float]]]:
+        cache = self._query_cache.get(user_id)
+        if cache is None or key not in cache:
+            return None
+        cache.move_to_end(key)
+        return list(cache[key])
+
+    def _remember_results(
+        self, user_id: str, key: Tuple[str, int], results: List[Tuple[str, float]], generation: int
+    ) -> None:
+        if generation != self._generation(user_id):
+            # A write overlapped this search; its results may predate the write
+            return
+        cache = self._query_cache.setdefault(user_id, OrderedDict())
+        cache[key] = list(results)
+        cache.move_to_end(key)
+        while len(cache) > _QUERY_CACHE_SIZE:
+            cache.popitem(last=False)
 
     def _run_sync(self, coro):
-        """Run an async coroutine from sync context; raise if already in running loop."""
+        """Run an async coroutine from sync context; raise if already in running loop.
+
+        The embedding client is closed before the temporary loop ends, since its
+        connections can't be released once that loop is gone.
+        """
         try:
             asyncio.get_running_loop()
         except RuntimeError:
-            return asyncio.run(coro)
+            return asyncio.run(self._closing(coro))
         coro.close()
         raise RuntimeError("Cannot call sync PGVectorStore method while an event loop is running; use the async variant instead.")
 
-    async def aadd_documents(self, documents: List[str], ids: List[str], user_id: str):
-        """Compute embeddings and upsert to Postgres for a user (async)."""
+    async def aadd_documents(
+        self,
+        documents: List[str],
+        ids: List[str],
+        user_id: str,
+        embeddings: Optional[List[List[float]]] = None,
+    ):
+        """Compute embeddings and upsert to Postgres for a user (async).
+
+        Pass `embeddings` (one vector per document) to skip the embedding call when
+        the caller has already computed them in a larger batch.
+        """
         pool = get_async_pool()
         if not pool:
             raise RuntimeError("Database pool not initialized")
+        if embeddings is not None and len(embeddings) != len(documents):
+            raise ValueError("embeddings must have one vector per document")
 
-        # Truncate documents to avoid token limit errors (512 tokens max for the embedding model)
-        truncated_docs = [doc[:500] for doc in documents]
+        self._invalidate(user_id)
         try:
-            embs = await self._emb.aembed_documents(truncated_docs)
+            if embeddings is None:
+                embs = await self._emb.aembed_documents(embedding_inputs(documents))
+            else:
+                embs = embeddings
+            rows = [(id_, user_id, doc, Vector(emb)) for id_, doc, emb in zip(ids, documents, embs)]
             async with pool.connection() as conn:
                 async with conn.cursor() as cur:
-                    for id_, doc, emb in zip(ids, documents, embs):
-                        await cur.execute(
+                    # executemany pipelines the upserts: one network flush per chunk, not per row
+                    for start in range(0, len(rows), _UPSERT_CHUNK):
+                        await cur.executemany(
                             f"""
                             INSERT INTO {self.table_name} (id, user_id, content, embedding)
                             VALUES (%s, %s, %s, %s)
                             ON CONFLICT (id) DO UPDATE SET content = EXCLUDED.content, embedding = EXCLUDED.embedding;
                             """,
-                            (id_, user_id, doc, Vector(emb)),
+                            rows[start:start + _UPSERT_CHUNK],
                         )
             self._logger.info("Added %d documents user=%s", len(documents), user_id)
             return "Documents added successfully."
         except Exception as e:
             self._logger.exception("Error adding documents: %s", e)
             return f"Error adding documents: {e}"
+        finally:
+            # Reads that ran during the write may have cached the old rows
+            self._invalidate(user_id)
 
-    def add_documents(self, documents: List[str], ids: List[str], user_id: str):
-        return self._run_sync(self.aadd_documents(documents, ids, user_id))
+    def add_documents(
+        self,
+        documents: List[str],
+        ids: List[str],
+        user_id: str,
+        embeddings: Optional[List[List[float]]] = None,
+    ):
+        return self._run_sync(self.aadd_documents(documents, ids, user_id, embeddings=embeddings))
 
     async def adelete_user_documents(self, user_id: str):
         pool = get_async_pool()
         if not pool:
             raise RuntimeError("Database pool not initialized")
+        self._invalidate(user_id)
         try:
             async with pool.connection() as conn:
                 async with conn.cursor() as cur:
@@ -84,10 +173,31 @@ class PGVectorStore:
         except Exception as e:
             self._logger.exception("Error deleting user documents: %s", e)
             return f"Error deleting user documents: {e}"
+        finally:
+            self._invalidate(user_id)
 
     def delete_user_documents(self, user_id: str):
         return self._run_sync(self.adelete_user_documents(user_id))
 
+    async def aget_user_documents(self, user_id: str) -> Dict[str, str]:
+        """Return the stored {id: content} map for a user (no embeddings)."""
+        cached = self._documents_cache.get(user_id)
+        if cached is not None:
+            return dict(cached)
+        pool = get_async_pool()
+        if not pool:
+            raise RuntimeError("Database pool not initialized")
+        generation = self._generation(user_id)
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(f"SELECT id, content FROM {self.table_name} WHERE user_id = %s", (user_id,))
+                rows = await cur.fetchall()
+        documents = {r[0]: r[1] for r in rows}
+        # A read that overlapped a write may hold the old rows; don't let it stick
+        if generation == self._generation(user_id):
+            self._documents_cache[user_id] = documents
+        return dict(documents)
+
     async def acount_user_documents(self, user_id: str) -> int:
         pool = get_async_pool()
         if not pool:
@@ -98,6 +208,34 @@ class PGVectorStore:
                 row = await cur.fetchone()
                 return row[0] if row else 0
 
+    async def _search(self, cur, q_emb: List[float], user_id: str, n_results: int) -> List[Tuple[str, float]]:
+        if self.exact_search:
+            # MATERIALIZED keeps the planner from pushing the ORDER BY into the HNSW index.
+            # The scan compares half-precision copies, halving the bytes each distance reads.
+            sql = f"""
+            WITH user_docs AS MATERIALIZED (
+                SELECT content, id, embedding::halfvec({self.dim}) AS embedding
+                FROM {self.table_name} WHERE user_id = %s
+            )
+            SELECT content, id, embedding <-> %s::halfvec({self.dim}) AS distance
+            FROM user_docs
+            ORDER BY distance
+            LIMIT %s;
+            """
+            params = (user_id, Vector(q_emb), n_results)
+        else:
+            sql = f"""
+            SELECT content, id, embedding <-> %s AS distance
+            FROM {self.table_name}
+            WHERE user_id = %s
+            ORDER BY distance
+            LIMIT %s;
+            """
+            params = (Vector(q_emb), user_id, n_results)
+        await cur.execute(sql, params)
+        rows = await cur.fetchall()
+        return list(zip([r[0] for r in rows], [r[2] for r in rows]))
+
     async def aquery(self, query: str, user_id: Optional[str], n_results: int = 10) -> List[Tuple[str, float]]:
         """Return (content, distance) tuples for the closest documents of a user."""
         pool = get_async_pool()
@@ -106,22 +244,56 @@ class PGVectorStore:
 
         if user_id is None:
             raise ValueError("user_id is required for pgvector queries")
+        key = self._query_key(query, n_results)
+        cached = self._cached_results(user_id, key)
+        if cached is not None:
+            return cached
+        generation = self._generation(user_id)
         try:
             q_emb = await self._emb.aembed_query(query)
             async with pool.connection() as conn:
                 async with conn.cursor() as cur:
-                    await cur.execute(
-                        f"""
-                        SELECT content, id, embedding <-> %s AS distance
-                        FROM {self.table_name}
-                        WHERE user_id = %s
-                        ORDER BY distance
-                        LIMIT %s;
-                        """,
-                        (Vector(q_emb), user_id, n_results),
-                    )
-                    rows = await cur.fetchall()
-            return list(zip([r[0] for r in rows], [r[2] for r in rows]))
+                    results = await self._search(cur, q_emb, user_id, n_results)
+            self._remember_results(user_id, key, results, generation)
+            return results
         except Exception as e:
             self._logger.exception("Error querying: %s", e)
             return f"Error querying: {e}"
+
+    async def aquery_many(self, queries: List[str], user_id: Optional[str], n_results: int = 10) -> List[List[Tuple[str, float]]]:
+        """Batched `aquery`: one embedding request and one pooled connection for all queries.
+
+        Returns one result list per query, in input order (or the error string for each
+        query on failure, mirroring `aquery`). Cached and repeated queries are only
+        embedded and searched once.
+        """
+        pool = get_async_pool()
+        if not pool:
+            raise RuntimeError("Database pool not initialized")
+
+        if user_id is None:
+            raise ValueError("user_id is required for pgvector queries")
+        if not queries:
+            return []
+        keys = [self._query_key(q, n_results) for q in queries]
+        found = {}
+        misses = {}
+        for query, key in zip(queries, keys):
+            cached = self._cached_results(user_id, key)
+            if cached is not None:
+                found[key] = cached
+            elif key not in misses:
+                misses[key] = query
+        generation = self._generation(user_id)
+        try:
+            if misses:
+                q_embs = await self._emb.aembed_documents(list(misses.values()))
+                async with pool.connection() as conn:
+                    async with conn.cursor() as cur:
+                        for key, q_emb in zip(misses, q_embs):
+                            found[key] = await self._search(cur, q_emb, user_id, n_results)
+                            self._remember_results(user_id, key, found[key], generation)
+            return [list(found[key]) for key in keys]
+        except Exception as e:
+            self._logger.exception("Error querying: %s", e)
+            return [f"Error querying: {e}"] * len(queries)
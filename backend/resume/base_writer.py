@@ -1,7 +1,38 @@
+import functools
+import os
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import pandas as pd
 
+
+@functools.lru_cache(maxsize=32)
+def _load_jobs(path: str, mtime: float) -> Tuple[pd.DataFrame, Dict[str, List[Dict[str, Any]]]]:
+    """Parse a jobs CSV and index its rows by company, once per (path, mtime).
+
+    Every writer built for the same upload shares the result, so callers must treat
+    both the frame and the row dicts as read-only. A re-upload changes the mtime.
+    """
+    data = pd.read_csv(path, dtype={"type": "category", "company": "category"})
+    # Ensure expected columns exist; create empty if missing
+    for col in ["start_date","end_date"]:
+        if col not in data.columns:
+            data[col] = None
+    # Parse dates if present; tolerate parse errors
+    for col in ["start_date","end_date"]:
+        try:
+            data[col] = pd.to_datetime(data[col], format="%d/%m/%Y", errors='coerce')
+        except Exception:
+            pass
+    # Index once so writers do dict lookups instead of a boolean-mask scan per field
+    rows_by_company: Dict[str, List[Dict[str, Any]]] = {}
+    for record in data.to_dict(orient="records"):
+        rows_by_company.setdefault(record.get("company"), []).append(record)
+    return data, rows_by_company
+
+
+def _is_blank(value: Any) -> bool:
+    return value is None or value == "" or (not isinstance(value, str) and pd.isna(value))
+
 class BaseWriter(ABC):
     """
     BaseWriter is an abstract base class that provides a foundation for creating
@@ -9,8 +40,16 @@ class BaseWriter(ABC):
     responses, converting to PDF, and generating files, which must be implemented
     by subclasses.
     Attributes:
-        data (pd.DataFrame): A pandas DataFrame containing job data loaded from a CSV file.
+        data (pd.DataFrame): A pandas DataFrame containing job data loaded from a CSV file
+            (shared between writers of the same file; read-only).
+        rows_by_company (dict): The CSV rows as dicts, grouped by their `company` value
+            (also the key of info rows such as name, email or website).
     Methods:
+        prepare():
+            Optional warm-up that does not need the response; callers run it while
+            the model is still generating.
+        output_paths(output: str) -> tuple:
+            The (source, PDF) paths `write` produces for an output path.
         write(response: dict, output: str = None, to_pdf: bool = False):
             Abstract method to write the response to a file or other output.
         to_pdf(output: str, src_path: str = None) -> str:
@@ -27,23 +66,63 @@ class BaseWriter(ABC):
         profile_image_path: Optional[str] = None,
     ):
         try:
-            data = pd.read_csv(csv_location)
+            self.data, self.rows_by_company = _load_jobs(
+                os.path.abspath(csv_location), os.path.getmtime(csv_location)
+            )
         except FileNotFoundError:
             raise FileNotFoundError(f"Jobs CSV not found at '{csv_location}'. Ensure you POST /upload-jobs/{{user_id}} before generating a resume.")
-        # Ensure expected columns exist; create empty if missing
-        for col in ["start_date","end_date"]:
-            if col not in data.columns:
-                data[col] = None
-        # Parse dates if present; tolerate parse errors
-        for col in ["start_date","end_date"]:
-            try:
-                data[col] = pd.to_datetime(data[col], format="%d/%m/%Y", errors='coerce')
-            except Exception:
-                pass
-        self.data = data
         self.file_ending = template.split(".")[-1] if template else file_ending
         self.profile_image_path = profile_image_path
 
+    def info_values(self, key: str, field: str = "description") -> List[str]:
+        """`field` of every row whose company is `key`, in CSV order; blanks/NaN skipped."""
+        values = []
+        for record in self.rows_by_company.get(key, []):
+            value = record.get(field)
+            if _is_blank(value):
+                continue
+            values.append(value)
+        return values
+
+    def first_info(self, key: str, default: str = "") -> str:
+        """First non-empty description stored for an info row such as 'name' or 'email'."""
+        values = self.info_values(key)
+        return values[0] if values else default
+
+    def contact_info(self) -> Dict[str, Any]:
+        """Header fields (name, address, phone, email, websites) from the info rows.
+
+        `websites` is a list of (url, label) pairs; the label is the row's role,
+        falling back to the url when the role is blank.
+        """
+        websites = []
+        for record in self.rows_by_company.get("website", []):
+            url, label = record.get("description"), record.get("role")
+            if _is_blank(url):
+                continue
+            websites.append((url, url if _is_blank(label) else label))
+        info = {key: self.first_info(key) for key in ("name", "address", "phone", "email")}
+        info["websites"] = websites
+        return info
+
+    def output_paths(self, output: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """(source path, PDF path) for `output`, which may name either of the two.
+
+        Only a trailing source/.pdf extension is swapped, so "a.pdf.bak.pdf" maps to
+        "a.pdf.bak.docx" rather than having every ".pdf" in the name replaced.
+        """
+        if not output:
+            return None, None
+        source_ext = "." + (self.file_ending or "").lstrip(".")
+        stem, ext = os.path.splitext(output)
+        if ext.lower() not in (source_ext, ".pdf"):
+            stem = output
+        return stem + source_ext, stem + ".pdf"
+
+    def prepare(self) -> None:
+        """Do response-independent setup ahead of `write`. The default does nothing."""
+        return None
+
     @abstractmethod
     def write(self,response:dict, output: str = None,to_pdf:bool=False):
         """Write the response to a file or other output."""
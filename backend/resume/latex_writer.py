@@ -1,11 +1,46 @@
+import atexit
+import functools
 import os
 import logging
+import re
 import shutil
-from typing import Dict, Optional
-import pandas as pd
+import subprocess
+import tempfile
+from typing import Optional
+import jinja2
 from .base_writer import BaseWriter
 from models.resume import ResumeOutputFormat
-import pdflatex
+
+# Identical for every resume, so it can be preloaded into a pdflatex format file
+_PREAMBLE = [
+    r"\documentclass[11pt]{article}",
+    r"\usepackage[margin=1in]{geometry}",
+    r"\usepackage{graphicx}",
+    r"\usepackage{enumitem}",
+    r"\usepackage[hidelinks]{hyperref}",
+    r"\usepackage{titlesec}",
+    r"\usepackage{parskip}",
+    r"\setlength{\parindent}{0pt}",
+]
+_FORMAT_NAME = "betterresume"
+# A stuck compile would otherwise hold a render-pool thread indefinitely
+_PDFLATEX_TIMEOUT = 120
+_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# One translate() table: a single C-level pass per string instead of a Python loop per character
+_LATEX_ESCAPES = str.maketrans({
+    "\\": r"\textbackslash{}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+})
+_UNESCAPED_AMPERSAND = re.compile(r'(?<!\\)&')
 
 def _latex_escape(text: str) -> str:
     """Escape LaTeX special characters in arbitrary text.
@@ -16,22 +51,60 @@ def _latex_escape(text: str) -> str:
     """
     if text is None:
         return ""
-    replacements = {
-        "\\": r"\textbackslash{}",
-        "&": r"\&",
-        "%": r"\%",
-        "$": r"\$",
-        "#": r"\#",
-        "_": r"\_",
-        "{": r"\{",
-        "}": r"\}",
-        "~": r"\textasciitilde{}",
-        "^": r"\textasciicircum{}",
-    }
-    out = []
-    for ch in str(text):
-        out.append(replacements.get(ch, ch))
-    return "".join(out)
+    return str(text).translate(_LATEX_ESCAPES)
+
+@functools.lru_cache(maxsize=1)
+def _template() -> jinja2.Template:
+    """Load and compile templates/resume.tex.j2 once per process.
+
+    Jinja's default {{ }}/{% %} delimiters clash with LaTeX braces, so the template
+    uses ((( ))) for values, ((* *)) for blocks and ((= =)) for comments.
+    """
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(_TEMPLATE_DIR),
+        block_start_string="((*",
+        block_end_string="*))",
+        variable_start_string="(((",
+        variable_end_string=")))",
+        comment_start_string="((=",
+        comment_end_string="=))",
+        trim_blocks=True,
+        autoescape=False,
+        undefined=jinja2.StrictUndefined,
+    )
+    env.filters["tex"] = _latex_escape
+    return env.get_template("resume.tex.j2")
+
+@functools.lru_cache(maxsize=1)
+def _preamble_format() -> Optional[str]:
+    """Dump the resume preamble into a pdflatex format once per process.
+
+    Compiling with ``-fmt`` then skips loading geometry/hyperref/titlesec/etc. on
+    every resume; mylatexformat makes pdflatex skip the (identical) preamble in the
+    source file. Returns the .fmt path, or None if it could not be built, in which
+    case callers compile the plain way.
+    """
+    logger = logging.getLogger("betterresume.writer")
+    fmt_dir = tempfile.mkdtemp(prefix="betterresume_latex_fmt_")
+    atexit.register(shutil.rmtree, fmt_dir, ignore_errors=True)
+    src = os.path.join(fmt_dir, "preamble.tex")
+    with open(src, "w", encoding="utf-8") as fh:
+        fh.write("\n".join(_PREAMBLE + [r"\begin{document}", r"\end{document}"]))
+    try:
+        subprocess.run(
+            ["pdflatex", "-ini", "-interaction=nonstopmode", f"-jobname={_FORMAT_NAME}",
+             f"-output-directory={fmt_dir}", "&pdflatex", "mylatexformat.ltx", src],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=_PDFLATEX_TIMEOUT,
+        )
+    except Exception as exc:
+        logger.warning("Could not build the LaTeX preamble format; compiling without it: %s", exc)
+        return None
+    fmt_path = os.path.join(fmt_dir, _FORMAT_NAME + ".fmt")
+    if not os.path.isfile(fmt_path):
+        return None
+    logger.info("Built LaTeX preamble format at %s", fmt_path)
+    return fmt_path
+
 
 class LatexResumeWriter(BaseWriter):
     """
@@ -67,45 +140,24 @@ class LatexResumeWriter(BaseWriter):
         self._logger = logging.getLogger("betterresume.writer")
 
 
+    def prepare(self) -> None:
+        # Compile the template and build the preamble format (once per process)
+        _template()
+        _preamble_format()
+
     def write(self, response: ResumeOutputFormat, output: str = None, to_pdf: bool = False):
-        tex_file = self.generate_file(response, output.replace(".pdf", ".tex") if output else None)
+        tex_path, pdf_path = self.output_paths(output)
+        tex_file = self.generate_file(response, tex_path)
         self._logger.info("LaTeX file generated: %s", tex_file)
         if not to_pdf:
             return tex_file
-        pdf = self.to_pdf(output.replace(".tex", ".pdf"), tex_file)
+        pdf = self.to_pdf(pdf_path, tex_file)
         self._logger.info("PDF generated: %s", pdf)
         return pdf
 
     def generate_file(self, response: ResumeOutputFormat, output: str = None):
         self.response = response
-        data = self.data
-        # Safe accessors for optional info rows
-        def _safe_first(df, default=""):
-            try:
-                return df.values[0]
-            except Exception:
-                return default
-        name = _latex_escape(_safe_first(data[data['company'] == 'name']['description'], ""))
-        title = _latex_escape(response.resume_section.title)
-        address = _latex_escape(_safe_first(data[data['company'] == 'address']['description'], ""))
-        phone = _latex_escape(_safe_first(data[data['company'] == 'phone']['description'], ""))
-        email = _latex_escape(_safe_first(data[data['company'] == 'email']['description'], ""))
-        websites = data[data['company'] == 'website']['description'].tolist()
-        websites_names= data[data['company'] == 'website']['role'].tolist()
-        websites = {w: _latex_escape(n) for w, n in zip(websites, websites_names)}
-
-        tex = []
-        tex.append(r"\documentclass[11pt]{article}")
-        tex.append(r"\usepackage[margin=1in]{geometry}")
-        tex.append(r"\usepackage{graphicx}")
-        tex.append(r"\usepackage{enumitem}")
-        tex.append(r"\usepackage[hidelinks]{hyperref}")
-        tex.append(r"\usepackage{titlesec}")
-        tex.append(r"\usepackage{parskip}")
-        tex.append(r"\setlength{\parindent}{0pt}")
-        tex.append(r"\begin{document}")
-
-        # Header
+        # Profile image is copied next to the .tex so pdflatex finds it by basename
         profile_path = getattr(self, "profile_image_path", None)
         image_basename = None
         if profile_path and os.path.isfile(profile_path):
@@ -129,80 +181,23 @@ class LatexResumeWriter(BaseWriter):
         elif profile_path:
             self._logger.debug("Profile image path not found: %s", profile_path)
 
-        if image_basename:
-            tex.append(r"\begin{minipage}[t]{0.25\textwidth}")
-            tex.append(r"\centering")
-            tex.append(r"\includegraphics[width=1.5in,keepaspectratio]{" + image_basename.replace('\\', '/') + r"}")
-            tex.append(r"\end{minipage}\hfill")
-            tex.append(r"\begin{minipage}[t]{0.72\textwidth}")
-            tex.append(r"\raggedright")
-            tex.append(r"\textbf{\LARGE " + name + r"}\\")
-            if title:
-                tex.append(r"\textit{" + title + r"}\\")
-            contact_parts = [p for p in [address, phone, email] if p]
-            if contact_parts:
-                tex.append(r" \\ ".join(contact_parts))
-            if websites:
-                tex.append(r"\\ " + " | ".join([r"\href{" + w + "}{" + websites.get(w, w) + r"}" for w in websites]))
-            tex.append(r"\end{minipage}")
-        else:
-            tex.append(r"\begin{center}")
-            tex.append(r"\textbf{\LARGE " + name + r"}\\")
-            if title:
-                tex.append(r"\textit{" + title + r"}\\")
-            contact_parts = [p for p in [address, phone, email] if p]
-            if contact_parts:
-                tex.append(r" \\ ".join(contact_parts))
-            if websites:
-                tex.append(r"\\ " + " | ".join([r"\href{" + w + "}{" + websites.get(w, w) + r"}" for w in websites]))
-            tex.append(r"\end{center}")
-        tex.append(r"\vspace{0.5cm}")
-
-        # Summary
-        tex.append(r"\section*{Professional Summary}")
-        tex.append(_latex_escape(response.resume_section.professional_summary))
-
-        # Skills
-        tex.append(r"\section*{Skills}")
-        tex.append(r"\begin{itemize}[leftmargin=*]")
-        for skill in response.resume_section.skills:
-            tex.append(r"\item \textbf{" + _latex_escape(skill.name) + r"} -- " + _latex_escape(skill.description))
-        tex.append(r"\end{itemize}")
-
-        # Experience
-        tex.append(r"\section*{Experience}")
-        for exp in response.resume_section.experience:
-            tex.append(r"\textbf{" + _latex_escape(exp.position) + r"} \hfill " + _latex_escape(exp.start_date) + " -- " + _latex_escape(exp.end_date))
-            tex.append(r"\\" + _latex_escape(exp.company) + ", " + _latex_escape(exp.location))
-            tex.append(r"\begin{itemize}[leftmargin=*]")
-            tex.append(r"\item " + _latex_escape(exp.description))
-            tex.append(r"\end{itemize}")
-
-        # Education
-        tex.append(r"\section*{Education and Certifications}")
-        for edu in response.resume_section.education:
-            tex.append(r"\textbf{" + _latex_escape(edu.institution) + r"} \hfill " + _latex_escape(edu.dates))
-            tex.append(r"\\" + _latex_escape(edu.degree))
-
-        # Languages
-        languages = getattr(response.resume_section, "languages", None) or []
-        if languages:
-            tex.append(r"\section*{Languages}")
-            tex.append(r"\begin{itemize}[leftmargin=*]")
-            for language in languages:
-                item = r"\item \textbf{" + _latex_escape(language.name) + r"}"
-                if language.proficiency:
-                    item += " -- " + _latex_escape(language.proficiency)
-                tex.append(item)
-            tex.append(r"\end{itemize}")
-
-        tex.append(r"\end{document}")
-
-        tex_content = "\n".join(tex)
+        # Raw values; the template escapes text fields with its `tex` filter
+        contact = self.contact_info()
+        section = response.resume_section
+        context = {
+            "preamble": _PREAMBLE,
+            "image": image_basename.replace('\\', '/') if image_basename else None,
+            "name": contact["name"],
+            "title": section.title,
+            "contact": [contact[k] for k in ("address", "phone", "email") if contact[k]],
+            "websites": contact["websites"],
+            "section": section,
+            "languages": getattr(section, "languages", None) or (),
+        }
+        tex_content = _template().render(context)
         # Safety net: in case any raw '&' slipped through (e.g., model output concatenated without escaping)
         # escape ampersands not already escaped. Avoid touching '\\&'.
-        import re
-        tex_content = re.sub(r'(?<!\\)&', r'\\&', tex_content)
+        tex_content = _UNESCAPED_AMPERSAND.sub(r'\\&', tex_content)
 
         if output:
             with open(output, "w", encoding="utf-8") as f:
@@ -213,12 +208,24 @@ class LatexResumeWriter(BaseWriter):
 
     def to_pdf(self, output: str, src_path: str = None):
         try:
-            import subprocess, os
             # Use pdflatex with explicit output directory to avoid cwd dependence
             out_dir = os.path.dirname(os.path.abspath(output))
             src_abs = os.path.abspath(src_path) if src_path else None
             # pdflatex will write PDF next to the .tex when using -output-directory
-            subprocess.run(["pdflatex", "-interaction=nonstopmode", f"-output-directory={out_dir}", src_abs], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            cmd = ["pdflatex", "-interaction=nonstopmode", f"-output-directory={out_dir}", src_abs]
+            fmt_path = _preamble_format()
+            try:
+                subprocess.run(
+                    cmd[:1] + [f"-fmt={fmt_path}"] + cmd[1:] if fmt_path else cmd,
+                    check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=_PDFLATEX_TIMEOUT,
+                )
+            except subprocess.CalledProcessError:
+                if not fmt_path:
+                    raise
+                self._logger.warning("Compiling with the preamble format failed; retrying without it")
+                subprocess.run(
+                    cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=_PDFLATEX_TIMEOUT,
+                )
             # Ensure expected name exists; move if needed
             generated = os.path.join(out_dir, os.path.splitext(os.path.basename(src_abs))[0] + ".pdf")
             if os.path.isfile(generated) and os.path.abspath(output) != generated:
@@ -1,14 +1,62 @@
+import atexit
+import functools
+import io
 import os
 import logging
+import pathlib
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future
 from docx import Document
-from docx.shared import Cm, Pt, Inches
+from docx.shared import Cm, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT, WD_ALIGN_VERTICAL
-from typing import Dict, Any, Optional
-import pandas as pd
+from typing import Optional
 from .base_writer import BaseWriter
 from models.resume import ResumeOutputFormat
-from utils.word_utils import set_paragraph_font, set_paragraph_format, set_heading_font, add_hyperlink
+from utils.word_utils import (
+    RESUME_BODY,
+    RESUME_BULLET,
+    RESUME_ENTRY,
+    RESUME_NAME,
+    RESUME_SECTION,
+    RESUME_TITLE,
+    add_hyperlinks,
+    add_resume_styles,
+    add_styled_paragraph,
+    resume_style_ids,
+)
+
+# Imported once here: a failed import is not cached by Python, so probing inside
+# to_pdf would rescan sys.path on every conversion on non-Windows hosts.
+try:
+    import comtypes  # type: ignore
+    import comtypes.client  # type: ignore
+except Exception:
+    comtypes = None
+
+# Page and header-table geometry, built once rather than per document
+_MARGINS = {"top_margin": Cm(2), "bottom_margin": Cm(1), "left_margin": Cm(2), "right_margin": Cm(2)}
+_IMAGE_CELL_WIDTH = Inches(1.75)
+_TEXT_CELL_WIDTH = Inches(6.0)
+_PROFILE_IMAGE_WIDTH = Inches(2.35)
+
+_SOFFICE_TIMEOUT = 120
+# One LibreOffice profile per render thread: soffice will not run two instances on
+# the same profile, and a reused profile skips first-run setup on later conversions.
+# Render threads are pooled, so this is a handful of dirs, each removed at exit.
+_soffice_profiles = threading.local()
+
+
+def _soffice_profile_uri() -> str:
+    path = getattr(_soffice_profiles, "path", None)
+    if path is None:
+        path = _soffice_profiles.path = tempfile.mkdtemp(prefix="betterresume-lo-")
+        atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return pathlib.Path(path).resolve().as_uri()
 
 class WordResumeWriter(BaseWriter):
     """
@@ -20,52 +68,69 @@ class WordResumeWriter(BaseWriter):
     generate_file(response: dict, output: str = None) -> Union[str, Document]:
         Creates a Word document with formatted resume content based on the provided response data.
     to_pdf(output: str, src_path: str = None) -> str:
-        Converts a Word document to a PDF file using the comtypes library.
+        Converts a Word document to a PDF file with headless LibreOffice, falling back to
+        Word over COM (comtypes) on Windows.
     """ 
+    # Word COM server shared by every writer in the process; starting Word is the
+    # dominant cost of the COM conversion, so it is launched once and kept alive.
+    _word = None
+    # COM objects belong to the apartment (thread) that created them while writers
+    # render on a thread pool, so every Word call runs on one dedicated thread.
+    _com_jobs = None
+    _com_start_lock = threading.Lock()
     def __init__(self, template: str = None, csv_location: str = "jobs.csv", profile_image_path: Optional[str] = None):
         super().__init__(template, csv_location, ".docx", profile_image_path=profile_image_path)
         self._logger = logging.getLogger("betterresume.writer")
+        self._prepared_document = None
+
+    def prepare(self) -> None:
+        # Template load and style registration don't depend on the response
+        self._prepared_document = self._new_document()
 
+    @staticmethod
+    def _new_document():
+        # Loading the saved base is ~3x faster than re-reading python-docx's default
+        # template and re-registering the styles. (A deepcopy of a parsed Document is
+        # as fast but unsafe: cached wrappers such as its body keep pointing at
+        # detached copies of the original elements.)
+        return Document(io.BytesIO(WordResumeWriter._base_document_bytes()))
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _base_document_bytes() -> bytes:
+        """Empty document with the resume styles and margins, saved once."""
+        document = Document()
+        add_resume_styles(document)
+
+        # Set reduced margins for the document
+        for section in document.sections:
+            for name, length in _MARGINS.items():
+                setattr(section, name, length)
+        buffer = io.BytesIO()
+        document.save(buffer)
+        return buffer.getvalue()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _style_ids():
+        # Documents loaded from the saved base share its style ids, so resolve the names once
+        return resume_style_ids(WordResumeWriter._new_document())
 
     def write(self,response:dict, output: str = None, to_pdf:bool=False):
-        file = self.generate_file(response, output.replace(".pdf", ".docx") if output else None)
+        docx_path, pdf_path = self.output_paths(output)
+        file = self.generate_file(response, docx_path)
         self._logger.info("DOCX generated: %s", file if isinstance(file, str) else output)
         if not to_pdf:
             return file
-        file = self.to_pdf(output.replace(".docx", ".pdf"), file)
+        file = self.to_pdf(pdf_path, file)
         self._logger.info("PDF generated: %s", file)
         return file
 
     def generate_file(self,response:ResumeOutputFormat, output: str = None):
         
-        data = self.data
-        
-
-        # Create the Word document
-        
-        document = Document()
-
-        # Set reduced margins for the document
-        sections = document.sections
-        for section in sections:
-            section.top_margin = Cm(2)  # Set top margin to 1 cm
-            section.bottom_margin = Cm(1)  # Set bottom margin to 1 cm
-            section.left_margin = Cm(2)  # Set left margin to 1 cm
-            section.right_margin = Cm(2)  # Set right margin to 1 cm
-
-        # Helper safe getters
-        def _safe_first(series, default: str = "") -> str:
-            try:
-                if series is None:
-                    return default
-                lst = series.to_list() if hasattr(series, "to_list") else list(series)
-                return lst[0] if lst else default
-            except Exception:
-                return default
+        # Create the Word document (or take the one prepare() built)
+        document, self._prepared_document = self._prepared_document or self._new_document(), None
 
-        
-        
         resume_section = response.resume_section
         
         profile_path = self.profile_image_path if getattr(self, "profile_image_path", None) else None
@@ -82,14 +147,14 @@ class WordResumeWriter(BaseWriter):
                 table_created.autofit = False
                 img_cell = table_created.rows[0].cells[0]
                 text_cell = table_created.rows[0].cells[1]
-                img_cell.width = Inches(1.75)
-                text_cell.width = Inches(6.0)
+                img_cell.width = _IMAGE_CELL_WIDTH
+                text_cell.width = _TEXT_CELL_WIDTH
                 img_cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
                 text_cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
                 img_paragraph = img_cell.paragraphs[0]
                 img_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
                 run = img_paragraph.add_run()
-                run.add_picture(profile_path, width=Inches(2.35))
+                run.add_picture(profile_path, width=_PROFILE_IMAGE_WIDTH)
                 header_container = text_cell
             except Exception as e:
                 self._logger.warning("Failed to insert profile image: %s", e)
@@ -101,16 +166,17 @@ class WordResumeWriter(BaseWriter):
                     except Exception:
                         pass
 
+        style_ids = self._style_ids()
+
+        def _styled(container, style: str, text: str = ""):
+            return add_styled_paragraph(container, style_ids[style], text)
+
         def _add_heading(container, text: str):
             if not text:
                 return None
             try:
-                if hasattr(container, "add_heading"):
-                    heading = container.add_heading(text, 0)
-                else:
-                    heading = container.add_paragraph(text)
-                set_heading_font(heading, font_name="Times New Roman", font_size=16)
-                return heading
+                style = RESUME_TITLE if hasattr(container, "add_heading") else RESUME_NAME
+                return _styled(container, style, text)
             except Exception as exc:
                 self._logger.debug("Failed adding heading: %s", exc)
                 return None
@@ -119,17 +185,16 @@ class WordResumeWriter(BaseWriter):
             if not text:
                 return None
             try:
-                paragraph = container.add_paragraph(text)
-                set_paragraph_font(paragraph)
-                set_paragraph_format(paragraph)
-                return paragraph
+                return _styled(container, RESUME_BODY, text)
             except Exception as exc:
                 self._logger.debug("Failed adding paragraph: %s", exc)
                 return None
 
+        contact = self.contact_info()
+
         # Heading (Name - Title)
         try:
-            name_txt = _safe_first(data[data['company'] == 'name']['description'], "")
+            name_txt = contact["name"]
             title_txt = resume_section.title
             heading_txt_parts = [p for p in [name_txt, title_txt] if p]
             if heading_txt_parts:
@@ -139,8 +204,8 @@ class WordResumeWriter(BaseWriter):
 
         # Address • Phone
         try:
-            address_txt = _safe_first(data[data['company'] == 'address']['description'], "")
-            phone_txt = _safe_first(data[data['company'] == 'phone']['description'], "")
+            address_txt = contact["address"]
+            phone_txt = contact["phone"]
             parts = [p for p in [address_txt, phone_txt] if p]
             if parts:
                 _add_paragraph(header_container, " • ".join(parts))
@@ -149,35 +214,23 @@ class WordResumeWriter(BaseWriter):
 
         # Email • Websites
         try:
-            email_txt = _safe_first(data[data['company'] == 'email']['description'], "")
-            websites = []
-            try:
-                websites = data[data["company"] == "website"]["description"].to_list()
-            except Exception:
-                websites = []
+            email_txt = contact["email"]
+            websites = [url for url, _ in contact["websites"]]
             if email_txt or websites:
                 p = _add_paragraph(header_container, f"{email_txt}" + (" • " if email_txt and websites else ""))
                 if p:
-                    for i, website in enumerate([w for w in websites if w]):
-                        try:
-                            add_hyperlink(p, website, website)
-                        except Exception:
-                            p.add_run(website)
-                        if i < len([w for w in websites if w]) - 1:
-                            p.add_run(" • ")
+                    add_hyperlinks(p, [(website, website) for website in websites])
         except Exception as e:
             self._logger.debug("Skipping email/websites due to missing data: %s", e)
 
         if header_container is not document:
-            document.add_paragraph("")
+            _styled(document, RESUME_BODY)
 
         # Professional summary
         try:
             summary_txt = resume_section.professional_summary
             if summary_txt:
-                summary_paragraph = document.add_paragraph(summary_txt)
-                set_paragraph_font(summary_paragraph)
-                set_paragraph_format(summary_paragraph)
+                _styled(document, RESUME_BODY, summary_txt)
         except Exception as e:
             self._logger.debug("Skipping professional summary: %s", e)
 
@@ -185,15 +238,11 @@ class WordResumeWriter(BaseWriter):
         try:
             skills = resume_section.skills
             if skills:
-                skills_heading = document.add_heading('SKILLS', level=0)
-                set_heading_font(skills_heading, font_name="Times New Roman", font_size=11)
+                _styled(document, RESUME_SECTION, 'SKILLS')
 
                 for skill in skills:
                     try:
-                        p = document.add_paragraph()
-                        p.style = "List Bullet"
-                        set_paragraph_font(p)
-                        set_paragraph_format(p)
+                        p = _styled(document, RESUME_BULLET)
                         name = skill.name
                         desc = skill.description
                         if name:
@@ -212,8 +261,7 @@ class WordResumeWriter(BaseWriter):
         try:
             experiences = resume_section.experience
             if experiences:
-                experience_heading = document.add_heading('EXPERIENCE', level=0)
-                set_heading_font(experience_heading, font_name="Times New Roman", font_size=11)
+                _styled(document, RESUME_SECTION, 'EXPERIENCE')
 
                 for experience in experiences:
                     try:
@@ -223,9 +271,7 @@ class WordResumeWriter(BaseWriter):
                         start_date = experience.start_date
                         end_date = experience.end_date
 
-                        p = document.add_paragraph()
-                        set_paragraph_font(p)
-                        set_paragraph_format(p)
+                        p = _styled(document, RESUME_ENTRY)
                         parts_left = []
                         if company:
                             run = p.add_run(company)
@@ -237,13 +283,6 @@ class WordResumeWriter(BaseWriter):
                         if parts_left:
                             p.add_run(" • " + " • ".join(parts_left))
 
-                        # Add a tab stop for right alignment
-                        try:
-                            tab_stop = p.paragraph_format.tab_stops.add_tab_stop(Inches(6.5))  # Adjust width as needed
-                            tab_stop.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                        except Exception:
-                            pass
-
                         date_right = None
                         if start_date or end_date:
                             end_txt = end_date if end_date and end_date.lower() != 'present' else 'Present'
@@ -252,10 +291,7 @@ class WordResumeWriter(BaseWriter):
 
                         desc = experience.description
                         if desc:
-                            p2 = document.add_paragraph()
-                            set_paragraph_font(p2)
-                            set_paragraph_format(p2)
-                            p2.add_run(desc)
+                            _styled(document, RESUME_BODY, desc)
                     except Exception:
                         continue
         except Exception as e:
@@ -265,8 +301,7 @@ class WordResumeWriter(BaseWriter):
         try:
             education_list = resume_section.education
             if education_list:
-                education_heading = document.add_heading('EDUCATION AND CERTIFICATIONS', level=0)
-                set_heading_font(education_heading, font_name="Times New Roman", font_size=11)
+                _styled(document, RESUME_SECTION, 'EDUCATION AND CERTIFICATIONS')
 
                 for edu in education_list:
                     try:
@@ -278,15 +313,7 @@ class WordResumeWriter(BaseWriter):
                         left_txt = ", ".join(left_parts) if left_parts else institution or degree
                         line_txt = left_txt if left_txt else ""
                         
-                        p = document.add_paragraph(line_txt)
-                        set_paragraph_font(p)
-                        set_paragraph_format(p)
-                        try:
-                            tab_stop = p.paragraph_format.tab_stops.add_tab_stop(Inches(6.5))
-                            tab_stop.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                        except Exception:
-                            pass
-                        
+                        p = _styled(document, RESUME_ENTRY, line_txt)
                         if dates:
                             p.add_run(f"\t{dates}")
                     except Exception:
@@ -298,15 +325,11 @@ class WordResumeWriter(BaseWriter):
         try:
             languages = getattr(resume_section, 'languages', None)
             if languages:
-                languages_heading = document.add_heading('LANGUAGES', level=0)
-                set_heading_font(languages_heading, font_name="Times New Roman", font_size=11)
+                _styled(document, RESUME_SECTION, 'LANGUAGES')
 
                 for language in languages:
                     try:
-                        p = document.add_paragraph()
-                        p.style = "List Bullet"
-                        set_paragraph_font(p)
-                        set_paragraph_format(p)
+                        p = _styled(document, RESUME_BULLET)
                         if language.name:
                             p.add_run(language.name).bold = True
                         if language.proficiency:
@@ -329,12 +352,13 @@ class WordResumeWriter(BaseWriter):
             return output
         # Prefer LibreOffice (Linux container)
         try:
-            import subprocess, shutil, sys
             if shutil.which("soffice") and src_path:
                 out_dir = os.path.dirname(os.path.abspath(output))
+                # Per-thread profiles let render workers convert side by side
                 subprocess.run([
-                    "soffice", "--headless", "--convert-to", "pdf", "--outdir", out_dir, os.path.abspath(src_path)
-                ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                    "soffice", f"-env:UserInstallation={_soffice_profile_uri()}",
+                    "--headless", "--convert-to", "pdf", "--outdir", out_dir, os.path.abspath(src_path)
+                ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=_SOFFICE_TIMEOUT)
                 # LibreOffice names file with .pdf in same dir; ensure expected name exists
                 generated = os.path.join(out_dir, os.path.splitext(os.path.basename(src_path))[0] + ".pdf")
                 if os.path.isfile(generated) and generated != os.path.abspath(output):
@@ -347,14 +371,76 @@ class WordResumeWriter(BaseWriter):
             pass
         # Fallback to Windows comtypes if available
         try:
-            if not src_path:
+            if not src_path or comtypes is None:
                 return output
-            import comtypes.client  # type: ignore
-            word = comtypes.client.CreateObject('Word.Application')
-            word.Visible = False
-            d = word.Documents.Open(os.path.abspath(src_path))
-            d.SaveAs(os.path.abspath(output), FileFormat=17)
-            d.Close(); word.Quit()
+            self._run_on_com_thread(self._convert_with_word, os.path.abspath(src_path), os.path.abspath(output))
             return output
         except Exception:
             return output
+
+    @classmethod
+    def _run_on_com_thread(cls, fn, *args, timeout: Optional[float] = None):
+        if comtypes is None:
+            raise RuntimeError("comtypes is not available")
+        with cls._com_start_lock:
+            if cls._com_jobs is None:
+                cls._com_jobs = queue.Queue()
+                threading.Thread(target=cls._com_loop, args=(cls._com_jobs,), name="word-com", daemon=True).start()
+        future = Future()
+        cls._com_jobs.put((fn, args, future))
+        return future.result(timeout=timeout)
+
+    @staticmethod
+    def _com_loop(jobs):
+        try:
+            comtypes.CoInitialize()
+        except Exception:
+            pass
+        while True:
+            fn, args, future = jobs.get()
+            try:
+                future.set_result(fn(*args))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+    @classmethod
+    def _convert_with_word(cls, src_path: str, output: str):
+        try:
+            d = cls._word_application().Documents.Open(src_path)
+            try:
+                d.SaveAs(output, FileFormat=17)
+            finally:
+                d.Close(False)
+        except Exception:
+            # A dead Word instance (closed by the user, crashed) is recreated next time
+            cls._word = None
+            raise
+
+    @classmethod
+    def _word_application(cls):
+        if cls._word is None:
+            # Late-bound IDispatch: skips generating the Word typelib wrappers
+            # (comtypes.gen) on first use, which is the bulk of COM cold start
+            word = comtypes.client.CreateObject('Word.Application', dynamic=True)
+            word.Visible = False
+            cls._word = word
+            # Word is recreated after a crash; keep a single exit hook for it
+            atexit.unregister(cls._quit_word)
+            atexit.register(cls._quit_word)
+        return cls._word
+
+    @classmethod
+    def _quit_word(cls):
+        try:
+            cls._run_on_com_thread(cls._quit_word_now, timeout=30)
+        except Exception:
+            pass
+
+    @classmethod
+    def _quit_word_now(cls):
+        word, cls._word = cls._word, None
+        if word is not None:
+            try:
+                word.Quit()
+            except Exception:
+                pass
@@ -69,6 +69,9 @@ class StubVectorStore:
         self.deleted_users.append(user_id)
         return "Deleted"
 
+    async def aget_user_documents(self, user_id: str) -> dict:
+        return dict(self.added)
+
     async def acount_user_documents(self, user_id: str) -> int:
         return len(self.added)
 
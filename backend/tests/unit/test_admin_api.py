@@ -38,7 +38,9 @@ def test_stats_returns_aggregates_for_admin():
         resp = client.get("/admin/stats?days=7")
 
     assert resp.status_code == 200
-    assert resp.json() == SAMPLE_STATS
+    body = resp.json()
+    assert set(body.pop("resume_cache")) == {"hits", "misses"}
+    assert body == SAMPLE_STATS
     mocked.assert_called_once_with(days=7)
 
 
@@ -56,6 +56,24 @@ def test_normalize_model_instance_passthrough():
     assert normalize_model_name(model) is model
 
 
+def test_openrouter_settings_built_once():
+    first = agent._model_settings("openrouter:wafer/fp4")
+    assert first["parallel_tool_calls"] is True
+    assert agent._model_settings("openrouter:other/model") is first
+    assert agent._model_settings("google:gemini-2.5-flash") is None
+
+
+def test_resolve_model_reuses_instance_per_name(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+    agent._resolve_model_name.cache_clear()
+    first = agent.resolve_model("openrouter:wafer/fp4")
+    assert agent.resolve_model("openrouter:wafer/fp4") is first
+    assert agent.resolve_model("openrouter:other/model") is not first
+    model = TestModel()
+    assert agent.resolve_model(model) is model
+    agent._resolve_model_name.cache_clear()
+
+
 # ---------------------------------------------------------------------------
 # Generation
 # ---------------------------------------------------------------------------
@@ -121,6 +139,129 @@ async def test_generate_without_required_retrieval_allows_direct_answer(stub_vec
     assert stub_vector_store.queries == []
 
 
+async def test_output_tool_is_strict(stub_vector_store, sample_resume_output):
+    """The resume output tool is declared strict so the provider constrain-decodes it."""
+    resume_args = sample_resume_output.model_dump()
+    seen = {}
+
+    def model_fn(messages, info: AgentInfo) -> ModelResponse:
+        output_tool = info.output_tools[0]
+        seen["strict"] = output_tool.strict
+        return ModelResponse(parts=[ToolCallPart(tool_name=output_tool.name, args=resume_args)])
+
+    await agent.generate(
+        "Backend role",
+        user_id="u1", vector_store=stub_vector_store, db=FakeDB(),
+        model=FunctionModel(model_fn), require_tool_call=False,
+    )
+
+    assert seen["strict"] is True
+
+
+async def test_parallel_search_calls_run_concurrently(sample_resume_output):
+    """Several search_experience calls in one model turn must overlap, not run back to back."""
+    import asyncio
+
+    resume_args = sample_resume_output.model_dump()
+    state = {"active": 0, "peak": 0}
+
+    class SlowStore:
+        async def aquery(self, query, user_id, n_results=10):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return [(query, 0.1)]
+
+    def model_fn(messages, info: AgentInfo) -> ModelResponse:
+        if len(messages) == 1:
+            return ModelResponse(parts=[
+                ToolCallPart(tool_name="search_experience", args={"query": q})
+                for q in ("python", "team leadership", "sql", "cloud")
+            ])
+        output_tool = next(t.name for t in info.output_tools)
+        return ModelResponse(parts=[ToolCallPart(tool_name=output_tool, args=resume_args)])
+
+    await agent.generate(
+        "Backend role", user_id="u1", vector_store=SlowStore(), db=FakeDB(), model=FunctionModel(model_fn),
+    )
+
+    assert state["peak"] == 4
+
+
+async def test_same_turn_searches_are_fused_into_one_store_query(sample_resume_output):
+    """Stores exposing aquery_many receive a turn's searches as one batched call."""
+    resume_args = sample_resume_output.model_dump()
+    batches = []
+
+    class BatchingStore:
+        async def aquery(self, query, user_id, n_results=10):
+            raise AssertionError("per-query path must not be used when aquery_many exists")
+
+        async def aquery_many(self, queries, user_id, n_results=10):
+            batches.append(list(queries))
+            return [[(f"doc for {q}", 0.1)] for q in queries]
+
+    queries = ("python", "team leadership", "sql", "cloud")
+
+    def model_fn(messages, info: AgentInfo) -> ModelResponse:
+        if len(messages) == 1:
+            return ModelResponse(parts=[
+                ToolCallPart(tool_name="search_experience", args={"query": q}) for q in queries
+            ])
+        output_tool = next(t.name for t in info.output_tools)
+        return ModelResponse(parts=[ToolCallPart(tool_name=output_tool, args=resume_args)])
+
+    await agent.generate(
+        "Backend role", user_id="u1", vector_store=BatchingStore(), db=FakeDB(), model=FunctionModel(model_fn),
+    )
+
+    assert batches == [list(queries)]
+
+
+async def test_generate_streams_progress_events(stub_vector_store, sample_resume_output):
+    """on_event receives search and writing progress while the run streams."""
+    model = TestModel(custom_output_args=sample_resume_output.model_dump())
+    events = []
+
+    resume = await agent.generate(
+        "Senior Python engineer needed",
+        user_id="u1", vector_store=stub_vector_store, db=FakeDB(), model=model, on_event=events.append,
+    )
+
+    assert isinstance(resume, ResumeOutputFormat)
+    stages = [e["stage"] for e in events]
+    assert "searching" in stages
+    assert stages[-1] == "writing"
+
+
+async def test_search_tool_clamps_n_results(stub_vector_store, sample_resume_output):
+    seen = []
+    original = stub_vector_store.aquery
+
+    async def recording_aquery(query, user_id, n_results=10):
+        seen.append(n_results)
+        return await original(query, user_id, n_results=n_results)
+
+    stub_vector_store.aquery = recording_aquery
+    resume_args = sample_resume_output.model_dump()
+
+    def model_fn(messages, info: AgentInfo) -> ModelResponse:
+        if len(messages) == 1:
+            return ModelResponse(parts=[
+                ToolCallPart(tool_name="search_experience", args={"query": "python", "n_results": 500}),
+            ])
+        return ModelResponse(parts=[ToolCallPart(tool_name=info.output_tools[0].name, args=resume_args)])
+
+    await agent.generate(
+        "Backend role",
+        user_id="u1", vector_store=stub_vector_store, db=FakeDB(),
+        model=FunctionModel(model_fn), require_tool_call=False,
+    )
+
+    assert seen == [agent.MAX_SEARCH_RESULTS]
+
+
 async def test_search_tool_without_store_returns_empty(sample_resume_output):
     """The search tool degrades gracefully when no vector store is wired in."""
     model = TestModel(custom_output_args=sample_resume_output.model_dump())
@@ -0,0 +1,98 @@
+"""Tests for the resume cache file and SSE encoding helpers in api.utils."""
+
+import json
+import os
+import tempfile
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="betterresume_test_"))
+
+import api.utils
+from api.state import RESUME_CACHE_STATS
+from api.utils import (
+    _build_result_signature,
+    _load_resume_cache,
+    _lookup_resume_cache,
+    _rendered_signature,
+    _save_resume_cache,
+    clean_output_dir,
+    sse_event,
+)
+
+
+def test_resume_cache_round_trips_non_ascii(tmp_path):
+    payload = {
+        "result_signature": "res-sig",
+        "render_signature": "render-sig",
+        "result": {"language": "es", "resume_section": {"title": "Ingeniera de Software — Señor"}},
+        "format": "word",
+        "generated_at": 123,
+    }
+
+    _save_resume_cache(str(tmp_path), payload)
+    cache = _load_resume_cache(str(tmp_path))
+
+    assert cache["results"]["res-sig"]["result"] == payload["result"]
+    assert cache["renders"]["render-sig"]["result_signature"] == "res-sig"
+
+
+def test_lookup_resume_cache_counts_hits_and_misses(tmp_path, monkeypatch):
+    monkeypatch.setitem(RESUME_CACHE_STATS, "hits", 0)
+    monkeypatch.setitem(RESUME_CACHE_STATS, "misses", 0)
+    _save_resume_cache(str(tmp_path), {"result_signature": "res", "render_signature": "render", "result": {"n": 1}})
+
+    assert _lookup_resume_cache(str(tmp_path), "render", "res") == (
+        _load_resume_cache(str(tmp_path))["renders"]["render"], {"n": 1},
+    )
+    assert _lookup_resume_cache(str(tmp_path), "other-render", "other-res") == (None, None)
+    assert RESUME_CACHE_STATS == {"hits": 1, "misses": 1}
+
+
+def test_load_resume_cache_tolerates_corrupt_file(tmp_path):
+    (tmp_path / "resume_cache.json").write_bytes(b"{not json")
+    assert _load_resume_cache(str(tmp_path)) is None
+
+
+def test_resume_cache_evicts_oldest_results(tmp_path, monkeypatch):
+    monkeypatch.setattr(api.utils, "RESUME_CACHE_MAX_RESULTS", 2)
+    for i in range(3):
+        _save_resume_cache(str(tmp_path), {
+            "result_signature": f"res-{i}",
+            "render_signature": f"render-{i}",
+            "result": {"n": i},
+            "generated_at": 100 + i,
+        })
+
+    cache = _load_resume_cache(str(tmp_path))
+
+    assert set(cache["results"]) == {"res-1", "res-2"}
+    assert set(cache["renders"]) == {"render-1", "render-2"}
+
+
+def test_clean_output_dir_keeps_cache_but_forgets_rendered_files(tmp_path):
+    out_dir = str(tmp_path)
+    _save_resume_cache(out_dir, {"result_signature": "res", "render_signature": "render", "result": {"n": 1}})
+    (tmp_path / "resume.docx").write_bytes(b"docx")
+    assert _rendered_signature(out_dir) == "render"
+
+    clean_output_dir(out_dir)
+
+    assert not (tmp_path / "resume.docx").exists()
+    assert _rendered_signature(out_dir) is None
+    assert "res" in _load_resume_cache(out_dir)["results"]
+
+
+def test_result_signature_changes_with_prompt_version(monkeypatch):
+    before = _build_result_signature(None, "csv", "job")
+    assert _build_result_signature(None, "csv", "job") == before
+
+    monkeypatch.setattr(api.utils, "_PROMPT_VERSION", "edited-prompt")
+
+    assert _build_result_signature(None, "csv", "job") != before
+
+
+def test_sse_event_is_utf8_data_frame():
+    frame = sse_event({"stage": "parsed", "message": "Currículum listo"})
+
+    assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+    assert json.loads(frame[len(b"data: "):].decode("utf-8")) == {"stage": "parsed", "message": "Currículum listo"}
+    assert "Currículum".encode("utf-8") in frame
@@ -0,0 +1,100 @@
+import os
+
+import pandas as pd
+import pytest
+
+from resume.base_writer import BaseWriter, _load_jobs
+
+
+class _Writer(BaseWriter):
+    def write(self, response, output=None, to_pdf=False):
+        pass
+
+    def to_pdf(self, output, src_path=None):
+        pass
+
+    def generate_file(self, response, output=None):
+        pass
+
+
+def _write_csv(path, description):
+    pd.DataFrame([
+        {"type": "info", "company": "name", "description": description,
+         "start_date": "", "end_date": ""},
+        {"type": "job", "company": "Acme", "description": "Built things",
+         "start_date": "01/02/2020", "end_date": "present"},
+    ]).to_csv(path, index=False)
+
+
+def test_writers_share_parsed_csv(tmp_path):
+    _load_jobs.cache_clear()
+    path = str(tmp_path / "jobs.csv")
+    _write_csv(path, "Jane Doe")
+
+    first, second = _Writer(csv_location=path), _Writer(csv_location=path)
+
+    assert first.data is second.data
+    assert first.first_info("name") == "Jane Doe"
+    assert first.data["start_date"].iloc[1] == pd.Timestamp(2020, 2, 1)
+    assert pd.isna(first.data["end_date"].iloc[1])
+    assert _load_jobs.cache_info().misses == 1
+
+
+def test_rewritten_csv_is_reparsed(tmp_path):
+    _load_jobs.cache_clear()
+    path = str(tmp_path / "jobs.csv")
+    _write_csv(path, "Jane Doe")
+    assert _Writer(csv_location=path).first_info("name") == "Jane Doe"
+
+    _write_csv(path, "John Roe")
+    mtime = os.path.getmtime(path) + 5
+    os.utime(path, (mtime, mtime))
+
+    assert _Writer(csv_location=path).first_info("name") == "John Roe"
+
+
+def test_contact_info_skips_blank_urls_and_falls_back_to_url_label(tmp_path):
+    path = tmp_path / "jobs.csv"
+    pd.DataFrame([
+        {"type": "info", "company": "name", "role": "", "description": "Jane Doe"},
+        {"type": "info", "company": "website", "role": "GitHub", "description": "https://github.com/jane"},
+        {"type": "info", "company": "website", "role": "", "description": "https://jane.dev"},
+        {"type": "info", "company": "website", "role": "Empty", "description": ""},
+    ]).to_csv(path, index=False)
+
+    contact = _Writer(csv_location=str(path)).contact_info()
+
+    assert contact["name"] == "Jane Doe"
+    assert contact["email"] == ""
+    assert contact["websites"] == [
+        ("https://github.com/jane", "GitHub"),
+        ("https://jane.dev", "https://jane.dev"),
+    ]
+
+
+@pytest.mark.parametrize("output, expected", [
+    ("out/resume.docx", ("out/resume.docx", "out/resume.pdf")),
+    ("out/resume.pdf", ("out/resume.docx", "out/resume.pdf")),
+    ("a.pdf.bak.pdf", ("a.pdf.bak.docx", "a.pdf.bak.pdf")),
+    ("resume", ("resume.docx", "resume.pdf")),
+    (None, (None, None)),
+])
+def test_output_paths_swaps_only_the_trailing_extension(tmp_path, output, expected):
+    path = str(tmp_path / "jobs.csv")
+    _write_csv(path, "Jane Doe")
+    assert _Writer(csv_location=path, file_ending=".docx").output_paths(output) == expected
+
+
+def test_word_writer_uses_prepared_document_once(tmp_path, sample_resume_output):
+    from resume.word_writer import WordResumeWriter
+
+    path = str(tmp_path / "jobs.csv")
+    _write_csv(path, "Jane Doe")
+    writer = WordResumeWriter(csv_location=path)
+    writer.prepare()
+    prepared = writer._prepared_document
+
+    assert writer.generate_file(sample_resume_output) is prepared
+    assert writer._prepared_document is None
+    assert writer.generate_file(sample_resume_output) is not prepared
+    assert WordResumeWriter._new_document().paragraphs == []
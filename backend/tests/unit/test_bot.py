@@ -41,9 +41,21 @@ async def test_generate_resume_english_skips_translation(sample_resume_output):
     translate.assert_not_awaited()
 
 
-async def test_generate_resume_non_english_triggers_translation(sample_resume_output):
+async def test_generate_resume_non_english_skips_translation_by_default(sample_resume_output):
+    """Generation writes in the JD's language, so no second translation pass runs."""
     bot = Bot(user_id="u1", auto_ingest=False)
 
+    with fake_agent(_resume(sample_resume_output, "es")) as (generate, translate):
+        result = await bot.generate_resume("descripción del puesto")
+
+    assert result.language == "es"
+    generate.assert_awaited_once()
+    translate.assert_not_awaited()
+
+
+async def test_generate_resume_non_english_triggers_translation(sample_resume_output):
+    bot = Bot(user_id="u1", auto_ingest=False, translate_pass=True)
+
     with fake_agent(
         generated=_resume(sample_resume_output, "es"),
         translated=_resume(sample_resume_output, "es"),
@@ -87,7 +99,29 @@ async def test_generate_resume_progress_yields_stages_and_merges_education(sampl
     assert final.resume_section.education[0].degree == "M.S. Computer Science"
     # Stored DD/MM/YYYY must be reformatted for display, not leaked raw
     assert final.resume_section.education[0].dates == "01/2021 - 12/2025"
-    fake_storage.get_job_experiences.assert_any_call("u1", type_filter="education")
+    # Context, language fallback and education all come from one unfiltered query
+    fake_storage.get_job_experiences.assert_called_once_with("u1")
+
+
+async def test_generate_resume_progress_forwards_streamed_agent_events(sample_resume_output):
+    bot = Bot(user_id="u1", auto_ingest=False)
+    generated = _resume(sample_resume_output, "en")
+
+    async def streaming_generate(jd, **kwargs):
+        kwargs["on_event"]({"stage": "searching", "message": "Searching experience: python"})
+        kwargs["on_event"]({"stage": "writing", "message": "Writing resume"})
+        return generated
+
+    fake_storage = MagicMock()
+    fake_storage.get_job_experiences.return_value = []
+
+    with patch("llm.agent.generate", side_effect=streaming_generate), \
+            patch("bot.DBStorage", return_value=fake_storage):
+        events = [e async for e in bot.generate_resume_progress("job description")]
+
+    stages = [e["stage"] for e in events]
+    assert stages == ["invoking_llm", "searching", "writing", "parsed", "done"]
+    assert events[-1]["result"] is generated
 
 
 async def test_generate_resume_progress_injects_stored_languages(sample_resume_output):
@@ -132,9 +166,26 @@ async def test_model_provided_languages_are_kept(sample_resume_output):
     assert [l.name for l in result.resume_section.languages] == ["English", "Spanish"]
 
 
+async def test_stored_languages_not_injected_untranslated_by_default(sample_resume_output):
+    """Without the translation pass nothing localizes raw DB values, so a non-English
+    resume keeps only what the model wrote from the context block."""
+    bot = Bot(user_id="u1", auto_ingest=False)
+
+    fake_storage = _storage_with_records([
+        {"type": "language", "role": "English", "description": "Full professional proficiency (C2)"},
+    ])
+
+    with fake_agent(_resume(sample_resume_output, "es")) as (_, translate), \
+            patch("bot.DBStorage", return_value=fake_storage):
+        result = await bot.generate_resume("descripción del puesto")
+
+    assert result.resume_section.languages == []
+    translate.assert_not_awaited()
+
+
 async def test_stored_languages_injected_before_translation(sample_resume_output):
     """Languages must be injected pre-translation so the translator localizes them."""
-    bot = Bot(user_id="u1", auto_ingest=False)
+    bot = Bot(user_id="u1", auto_ingest=False, translate_pass=True)
 
     fake_storage = _storage_with_records([
         {"type": "language", "role": "English", "description": "Full professional proficiency (C2)"},
@@ -183,7 +234,7 @@ async def test_generate_resume_survives_context_failure(sample_resume_output):
 
 
 async def test_generate_resume_progress_translates_non_english(sample_resume_output):
-    bot = Bot(user_id="u1", auto_ingest=False)
+    bot = Bot(user_id="u1", auto_ingest=False, translate_pass=True)
 
     fake_storage = MagicMock()
     fake_storage.get_job_experiences.return_value = []
@@ -220,6 +271,19 @@ async def test_auto_ingest_loads_csv_into_store(tmp_path, stub_vector_store):
     assert "company: Acme" in stub_vector_store.added[0][1]
 
 
+async def test_auto_ingest_skips_when_store_already_matches_csv(tmp_path, stub_vector_store):
+    csv_path = tmp_path / "jobs.csv"
+    csv_path.write_text("type,company,description\njob,Acme,Built stuff\n")
+    stub_vector_store.added = [("u1_0", "type: job\ncompany: Acme\ndescription: Built stuff")]
+
+    bot = Bot(user_id="u1", vector_store=stub_vector_store, auto_ingest=True, jobs_csv=str(csv_path))
+    if bot._auto_ingest_task:
+        await bot._auto_ingest_task
+
+    assert stub_vector_store.deleted_users == []
+    assert len(stub_vector_store.added) == 1
+
+
 async def test_translate_resume_accepts_dict(sample_resume_output):
     bot = Bot(user_id="u1", auto_ingest=False)
 
@@ -230,3 +294,19 @@ async def test_translate_resume_accepts_dict(sample_resume_output):
     # The dict must have been validated into a model before reaching the agent
     passed_resume = translate.await_args.args[0]
     assert isinstance(passed_resume, ResumeOutputFormat)
+
+
+async def test_generate_resumes_batch_runs_each_jd(sample_resume_output):
+    bot = Bot(user_id="u1", auto_ingest=False)
+
+    fake_storage = MagicMock()
+    fake_storage.get_job_experiences.return_value = []
+
+    with fake_agent(_resume(sample_resume_output, "en")) as (generate, translate), \
+            patch("bot.DBStorage", return_value=fake_storage):
+        results = await bot.generate_resumes_batch(["jd one", "jd two", "jd three"])
+
+    assert len(results) == 3
+    assert generate.await_count == 3
+    assert sorted(c.args[0] for c in generate.await_args_list) == ["jd one", "jd three", "jd two"]
+    translate.assert_not_awaited()
@@ -1,6 +1,8 @@
 """Tests for the httpx-based EmbeddingClient (replaces langchain_openai embeddings)."""
 
+import asyncio
 import json
+import threading
 
 import httpx
 import pytest
@@ -45,6 +47,29 @@ async def test_embed_documents_chunks_requests():
     assert [len(r["input"]) for r in requests] == [2, 2, 1]
 
 
+async def test_embed_documents_sends_chunks_concurrently():
+    in_flight = {"now": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        inputs = json.loads(request.content)["input"]
+        return httpx.Response(200, json={"data": [
+            {"index": i, "embedding": [float(len(text))]} for i, text in enumerate(inputs)
+        ]})
+
+    client = EmbeddingClient(
+        base_url="http://test/v1", chunk_size=1, max_concurrency=2, transport=httpx.MockTransport(handler),
+    )
+
+    embs = await client.aembed_documents(["a", "bb", "ccc", "dddd"])
+
+    assert embs == [[1.0], [2.0], [3.0], [4.0]]
+    assert in_flight["peak"] == 2
+
+
 async def test_embed_query_returns_single_vector():
     requests = []
     client = EmbeddingClient(base_url="http://test/v1", transport=_make_transport(requests))
@@ -62,6 +87,38 @@ async def test_embed_documents_raises_on_http_error():
         await client.aembed_documents(["a"])
 
 
+async def test_http_client_is_reused_across_calls():
+    requests = []
+    client = EmbeddingClient(base_url="http://test/v1", transport=_make_transport(requests))
+
+    await client.aembed_query("a")
+    first = client._http
+    await client.aembed_query("b")
+
+    assert client._http is first and not first.is_closed
+    await client.aclose()
+    assert first.is_closed
+
+
+def test_client_from_a_running_loop_is_closed_on_that_loop():
+    client = EmbeddingClient(base_url="http://test/v1", transport=_make_transport([]))
+    owner = asyncio.new_event_loop()
+    thread = threading.Thread(target=owner.run_forever)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(client.aembed_query("a"), owner).result(timeout=5)
+        stale = client._http
+
+        asyncio.run(client.aembed_query("b"))
+
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), owner).result(timeout=5)
+        assert stale.is_closed and client._http is not stale
+    finally:
+        owner.call_soon_threadsafe(owner.stop)
+        thread.join()
+        owner.close()
+
+
 def test_base_url_falls_back_to_env(monkeypatch):
     monkeypatch.setenv("EMBEDDING_SERVICE_URL", "http://from-env:80/v1/")
     client = EmbeddingClient()
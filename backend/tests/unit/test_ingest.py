@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from utils.ingest import ingest_jobs_csv, load_csv_documents
+from utils.ingest import ingest_jobs_csv, iter_csv_documents, load_csv_documents
 
 
 def test_load_csv_documents_formats_rows(tmp_path):
@@ -37,7 +37,7 @@ def test_ingest_jobs_csv_returns_row_count(tmp_path):
     csv_path = tmp_path / "jobs.csv"
     csv_path.write_text("type,company,description\njob,Acme,Did stuff\ncontract,Beta,Built things\n")
 
-    mock_store = MagicMock()
+    mock_store = MagicMock(aclose=AsyncMock())
     mock_store.aadd_documents = AsyncMock(return_value="Documents added successfully.")
 
     count = ingest_jobs_csv(str(csv_path), mock_store, "user_1")
@@ -48,7 +48,7 @@ def test_ingest_jobs_csv_calls_aadd_documents(tmp_path):
     csv_path = tmp_path / "jobs.csv"
     csv_path.write_text("type,company,description\njob,Acme,Did stuff\n")
 
-    mock_store = MagicMock()
+    mock_store = MagicMock(aclose=AsyncMock())
     mock_store.aadd_documents = AsyncMock(return_value="Documents added successfully.")
 
     ingest_jobs_csv(str(csv_path), mock_store, "user_abc")
@@ -58,9 +58,118 @@ def test_ingest_jobs_csv_calls_aadd_documents(tmp_path):
     assert ids == ["user_abc_0"]
     assert mock_store.aadd_documents.await_args.kwargs["user_id"] == "user_abc"
     assert "company: Acme" in docs[0]
+    mock_store.aclose.assert_awaited_once()
 
 
 def test_ingest_jobs_csv_raises_on_missing_file():
-    mock_store = MagicMock()
+    mock_store = MagicMock(aclose=AsyncMock())
     with pytest.raises(FileNotFoundError):
         ingest_jobs_csv("/nonexistent/path/jobs.csv", mock_store, "user_1")
+
+
+def test_ingest_jobs_csv_sends_batches_with_running_ids(tmp_path):
+    csv_path = tmp_path / "jobs.csv"
+    csv_path.write_text("type,company,description\n" + "".join(f"job,C{i},D{i}\n" for i in range(5)))
+
+    mock_store = MagicMock(aclose=AsyncMock())
+    mock_store.aadd_documents = AsyncMock(return_value="Documents added successfully.")
+
+    assert ingest_jobs_csv(str(csv_path), mock_store, "u", batch_size=2) == 5
+
+    batches = [call.args for call in mock_store.aadd_documents.await_args_list]
+    assert [ids for _, ids in batches] == [["u_0", "u_1"], ["u_2", "u_3"], ["u_4"]]
+    assert [len(docs) for docs, _ in batches] == [2, 2, 1]
+    assert "company: C4" in batches[-1][0][0]
+
+
+def test_iter_csv_documents_streams_rows_and_fails_eagerly(tmp_path):
+    csv_path = tmp_path / "jobs.csv"
+    csv_path.write_text("type,company\njob,A\njob,B\n")
+
+    rows = iter_csv_documents(str(csv_path))
+    assert next(rows) == "type: job\ncompany: A"
+    assert list(rows) == ["type: job\ncompany: B"]
+    with pytest.raises(FileNotFoundError):
+        iter_csv_documents(str(tmp_path / "missing.csv"))
+
+
+def test_ingest_jobs_csv_limits_batches_in_flight(tmp_path):
+    import asyncio
+
+    csv_path = tmp_path / "jobs.csv"
+    csv_path.write_text("type,company\n" + "".join(f"job,C{i}\n" for i in range(7)))
+    in_flight, peak, seen = 0, 0, []
+
+    async def add(docs, ids, user_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        seen.extend(ids)
+        return "Documents added successfully."
+
+    mock_store = MagicMock(aclose=AsyncMock())
+    mock_store.aadd_documents = AsyncMock(side_effect=add)
+
+    assert ingest_jobs_csv(str(csv_path), mock_store, "u", batch_size=2, workers=2) == 7
+    assert peak == 2
+    assert sorted(seen, key=lambda i: int(i.split("_")[1])) == [f"u_{i}" for i in range(7)]
+
+
+def test_ingest_jobs_csv_passes_embedder_vectors_to_store(tmp_path):
+    csv_path = tmp_path / "jobs.csv"
+    csv_path.write_text("type,company\njob,A\njob,B\n")
+    embedder = AsyncMock(side_effect=lambda docs: [[float(len(d))] for d in docs])
+
+    mock_store = MagicMock(aclose=AsyncMock())
+    mock_store.aadd_documents = AsyncMock(return_value="Documents added successfully.")
+
+    ingest_jobs_csv(str(csv_path), mock_store, "u", embedder=embedder)
+
+    embedder.assert_awaited_once_with(["type: job\ncompany: A", "type: job\ncompany: B"])
+    assert mock_store.aadd_documents.await_args.kwargs["embeddings"] == [[20.0], [20.0]]
+
+
+def test_ingest_jobs_csv_truncates_embedder_input_like_the_store(tmp_path):
+    csv_path = tmp_path / "jobs.csv"
+    csv_path.write_text("type,description\njob," + "x" * 1000 + "\n")
+    embedder = AsyncMock(side_effect=lambda docs: [[0.0] for _ in docs])
+
+    mock_store = MagicMock(aclose=AsyncMock())
+    mock_store.aadd_documents = AsyncMock(return_value="Documents added successfully.")
+
+    ingest_jobs_csv(str(csv_path), mock_store, "u", embedder=embedder)
+
+    (embedded,), _ = embedder.await_args
+    docs, _ = mock_store.aadd_documents.await_args.args
+    assert embedded == [docs[0][:500]] and len(docs[0]) > 500
+
+
+def test_ingest_jobs_csv_continues_ids_from_start_index(tmp_path):
+    first, second = tmp_path / "a.csv", tmp_path / "b.csv"
+    first.write_text("type,company\njob,A\njob,B\n")
+    second.write_text("type,company\njob,C\n")
+
+    mock_store = MagicMock(aclose=AsyncMock())
+    mock_store.aadd_documents = AsyncMock(return_value="Documents added successfully.")
+
+    offset = ingest_jobs_csv(str(first), mock_store, "u")
+    assert ingest_jobs_csv(str(second), mock_store, "u", start_index=offset) == 1
+
+    ids = [call.args[1] for call in mock_store.aadd_documents.await_args_list]
+    assert ids == [["u_0", "u_1"], ["u_2"]]
+
+
+def test_ingest_jobs_csv_skips_duplicate_rows(tmp_path):
+    csv_path = tmp_path / "jobs.csv"
+    csv_path.write_text("type,company\njob,A\njob,B\njob,A\njob,C\n")
+
+    mock_store = MagicMock(aclose=AsyncMock())
+    mock_store.aadd_documents = AsyncMock(return_value="Documents added successfully.")
+
+    assert ingest_jobs_csv(str(csv_path), mock_store, "u") == 3
+
+    docs, ids = mock_store.aadd_documents.await_args.args
+    assert ids == ["u_0", "u_1", "u_2"]
+    assert [d.splitlines()[1] for d in docs] == ["company: A", "company: B", "company: C"]
@@ -0,0 +1,32 @@
+"""Tests for the date normalization applied to uploaded job records."""
+
+import os
+import tempfile
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="betterresume_test_"))
+
+import pandas as pd
+import pytest
+
+from api.routers.jobs import _normalize_dates
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("1/2/2020", "01/02/2020"),
+    ("01-12-1999", "01/12/1999"),
+    ("3/2021", "01/03/2021"),
+    ("2021-12", "01/12/2021"),
+    (" Present ", "present"),
+    ("NOW", "present"),
+    ("", ""),
+    (None, ""),
+    ("2021", "2021"),
+    ("spring 2020", "spring 2020"),
+])
+def test_normalize_dates(raw, expected):
+    assert _normalize_dates(pd.Series([raw], dtype=object)).tolist() == [expected]
+
+
+def test_normalize_dates_mixed_column_keeps_order():
+    col = pd.Series(["2020/7", None, "current", "5/6/2019"], dtype=object)
+    assert _normalize_dates(col).tolist() == ["01/07/2020", "", "present", "05/06/2019"]
@@ -0,0 +1,48 @@
+import os
+
+import pandas as pd
+
+from resume import latex_writer
+from resume.latex_writer import LatexResumeWriter
+
+
+def _writer(tmp_path):
+    path = tmp_path / "jobs.csv"
+    pd.DataFrame([
+        {"type": "info", "company": "name", "role": "", "description": "Ada & Co_1"},
+        {"type": "info", "company": "email", "role": "", "description": "ada@example.com"},
+        {"type": "info", "company": "website", "role": "My_Blog", "description": "https://ada.dev"},
+    ]).to_csv(path, index=False)
+    return LatexResumeWriter(csv_location=str(path))
+
+
+def test_template_escapes_text_fields(tmp_path, sample_resume_output):
+    sample_resume_output.resume_section.skills[0].description = "50% of {x} & more_stuff"
+
+    tex = _writer(tmp_path).generate_file(sample_resume_output)
+
+    assert tex.startswith(r"\documentclass[11pt]{article}")
+    assert tex.endswith(r"\end{document}")
+    assert r"\textbf{\LARGE Ada \& Co\_1}\\" in tex
+    assert r"\\ \href{https://ada.dev}{My\_Blog}" in tex
+    assert r"50\% of \{x\} \& more\_stuff" in tex
+    assert r"\begin{center}" in tex and "minipage" not in tex
+
+
+def test_languages_section_only_when_present(tmp_path, sample_resume_output):
+    writer = _writer(tmp_path)
+    sample_resume_output.resume_section.languages = []
+    assert r"\section*{Languages}" not in writer.generate_file(sample_resume_output)
+
+
+def test_preamble_format_dir_is_removed_at_exit(monkeypatch):
+    cleanups = []
+    monkeypatch.setattr(latex_writer.atexit, "register", lambda fn, *a, **kw: cleanups.append((fn, a, kw)))
+    monkeypatch.setattr(latex_writer.subprocess, "run", lambda *a, **kw: None)
+
+    assert latex_writer._preamble_format.__wrapped__() is None
+
+    (fn, args, kwargs), = cleanups
+    assert os.path.isdir(args[0])
+    fn(*args, **kwargs)
+    assert not os.path.exists(args[0])
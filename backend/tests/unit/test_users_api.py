@@ -0,0 +1,29 @@
+"""Tests for the user management endpoints."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routers import users as users_router
+from api.state import USER_STORES
+
+
+def _client():
+    app = FastAPI()
+    app.include_router(users_router.router)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("delete_error", [None, RuntimeError("db down")])
+def test_clear_user_closes_the_dropped_store(monkeypatch, delete_error):
+    store = MagicMock(aclose=AsyncMock())
+    store.adelete_user_documents = AsyncMock(side_effect=delete_error)
+    monkeypatch.setitem(USER_STORES, "user_0001", store)
+
+    resp = _client().delete("/users/user_0001")
+
+    assert resp.status_code == (500 if delete_error else 200)
+    assert "user_0001" not in USER_STORES
+    store.aclose.assert_awaited_once()
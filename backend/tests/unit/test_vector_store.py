@@ -39,6 +39,188 @@ async def test_aquery_returns_error_string_on_embedding_failure(store):
     assert "Error" in result
 
 
+async def test_aquery_many_embeds_all_queries_in_one_request(store):
+    """Batched queries share one embedding call; failures map to one error per query."""
+    mock_emb = MagicMock()
+    mock_emb.aembed_documents = AsyncMock(side_effect=ConnectionError("service down"))
+    store._emb = mock_emb
+
+    with patch("llm.vector_store.get_async_pool", return_value=MagicMock()):
+        result = await store.aquery_many(["python", "sql"], "test_user")
+
+    mock_emb.aembed_documents.assert_awaited_once_with(["python", "sql"])
+    assert len(result) == 2
+    assert all("Error" in r for r in result)
+
+
+def _recording_pool(executed):
+    cur = MagicMock()
+    cur.execute = AsyncMock(side_effect=lambda sql, params: executed.append((sql, params)))
+    cur.fetchall = AsyncMock(return_value=[("doc", "id1", 0.2)])
+    cur_cm = MagicMock()
+    cur_cm.__aenter__ = AsyncMock(return_value=cur)
+    cur_cm.__aexit__ = AsyncMock(return_value=False)
+    conn = MagicMock()
+    conn.cursor.return_value = cur_cm
+    conn_cm = MagicMock()
+    conn_cm.__aenter__ = AsyncMock(return_value=conn)
+    conn_cm.__aexit__ = AsyncMock(return_value=False)
+    pool = MagicMock()
+    pool.connection.return_value = conn_cm
+    return pool
+
+
+@pytest.mark.parametrize("exact", [True, False])
+async def test_aquery_exact_search_scans_only_user_rows(store, exact):
+    """Exact mode materializes the user's rows so the HNSW index is not used for ordering."""
+    store.exact_search = exact
+    store._emb = MagicMock()
+    store._emb.aembed_query = AsyncMock(return_value=[0.0, 1.0])
+    executed = []
+
+    with patch("llm.vector_store.get_async_pool", return_value=_recording_pool(executed)):
+        result = await store.aquery("python", "test_user", n_results=3)
+
+    assert result == [("doc", 0.2)]
+    sql, params = executed[0]
+    assert ("MATERIALIZED" in sql) is exact
+    # Only the exact scan compares half-precision copies
+    assert ("halfvec(768)" in sql) is exact
+    assert "test_user" in params and 3 in params
+
+
+async def test_repeated_queries_are_served_from_cache(store):
+    """Normalized repeats skip embedding and search; writes through the store clear the cache."""
+    store._emb = MagicMock()
+    store._emb.aembed_query = AsyncMock(return_value=[0.0, 1.0])
+    store._emb.aembed_documents = AsyncMock(return_value=[[1.0, 0.0]])
+    executed = []
+
+    with patch("llm.vector_store.get_async_pool", return_value=_recording_pool(executed)):
+        first = await store.aquery("Python backend", "test_user", n_results=3)
+        assert await store.aquery("  python   BACKEND ", "test_user", n_results=3) == first
+        batched = await store.aquery_many(["python backend", "team leadership", "Team leadership"], "test_user", 3)
+        assert len(executed) == 2
+        store._emb.aembed_documents.assert_awaited_once_with(["team leadership"])
+        assert batched[0] == first and batched[1] == batched[2]
+
+        await store.adelete_user_documents("test_user")
+        await store.aquery("python backend", "test_user", n_results=3)
+
+    assert store._emb.aembed_query.await_count == 2
+
+
+async def test_query_during_write_is_not_cached(store):
+    """A search that overlaps an upsert must not leave pre-write results in the cache."""
+    import asyncio
+
+    release = asyncio.Event()
+
+    async def slow_embed(docs):
+        await release.wait()
+        return [[1.0, 0.0]] * len(docs)
+
+    store._emb = MagicMock()
+    store._emb.aembed_query = AsyncMock(return_value=[0.0, 1.0])
+    store._emb.aembed_documents = slow_embed
+    pool = _recording_pool([])
+    cur = pool.connection.return_value.__aenter__.return_value.cursor.return_value.__aenter__.return_value
+    cur.executemany = AsyncMock()
+
+    with patch("llm.vector_store.get_async_pool", return_value=pool):
+        write = asyncio.create_task(store.aadd_documents(["new"], ["id1"], "test_user"))
+        await asyncio.sleep(0)
+        await store.aquery("python", "test_user")
+        release.set()
+        await write
+        await store.aquery("python", "test_user")
+
+    assert store._emb.aembed_query.await_count == 2
+
+
+async def test_user_documents_cached_until_store_writes(store):
+    """Repeat ingest checks are served from memory; deleting through the store invalidates them."""
+    executed = []
+    pool = _recording_pool(executed)
+    cur = pool.connection.return_value.__aenter__.return_value.cursor.return_value.__aenter__.return_value
+    cur.fetchall = AsyncMock(return_value=[("test_user_0", "company: Acme")])
+
+    with patch("llm.vector_store.get_async_pool", return_value=pool):
+        first = await store.aget_user_documents("test_user")
+        second = await store.aget_user_documents("test_user")
+        assert first == second == {"test_user_0": "company: Acme"}
+        assert len(executed) == 1
+
+        await store.adelete_user_documents("test_user")
+        await store.aget_user_documents("test_user")
+
+    assert len(executed) == 3
+
+
+async def test_user_documents_read_during_write_is_not_cached(store):
+    """An ingest check that overlaps a write must not cache the pre-write document list."""
+    import asyncio
+
+    release = asyncio.Event()
+    pool = _recording_pool([])
+    cur = pool.connection.return_value.__aenter__.return_value.cursor.return_value.__aenter__.return_value
+    cur.fetchall = AsyncMock(return_value=[("id1", "old")])
+
+    async def slow_delete(sql, params):
+        await release.wait()
+
+    with patch("llm.vector_store.get_async_pool", return_value=pool):
+        cur.execute = AsyncMock(side_effect=slow_delete)
+        write = asyncio.create_task(store.adelete_user_documents("test_user"))
+        await asyncio.sleep(0)
+        cur.execute = AsyncMock()
+        assert await store.aget_user_documents("test_user") == {"id1": "old"}
+        release.set()
+        await write
+        # The read that ran during the delete was not left in the cache
+        assert "test_user" not in store._documents_cache
+        await store.aget_user_documents("test_user")
+
+    assert cur.fetchall.await_count == 2
+
+
+async def test_aadd_documents_upserts_in_chunks(store, monkeypatch):
+    """Rows are written with executemany per chunk rather than one execute per row."""
+    import llm.vector_store as vs
+
+    monkeypatch.setattr(vs, "_UPSERT_CHUNK", 2)
+    store._emb = MagicMock()
+    store._emb.aembed_documents = AsyncMock(return_value=[[0.0, 1.0]] * 3)
+    pool = _recording_pool([])
+    cur = pool.connection.return_value.__aenter__.return_value.cursor.return_value.__aenter__.return_value
+    cur.executemany = AsyncMock()
+
+    with patch("llm.vector_store.get_async_pool", return_value=pool):
+        await store.aadd_documents(["a", "b", "c"], ["id0", "id1", "id2"], "test_user")
+
+    batches = [call.args[1] for call in cur.executemany.await_args_list]
+    assert [[row[0] for row in batch] for batch in batches] == [["id0", "id1"], ["id2"]]
+    cur.execute.assert_not_awaited()
+
+
+async def test_aadd_documents_uses_precomputed_embeddings(store):
+    store._emb = MagicMock()
+    store._emb.aembed_documents = AsyncMock()
+    pool = _recording_pool([])
+    cur = pool.connection.return_value.__aenter__.return_value.cursor.return_value.__aenter__.return_value
+    cur.executemany = AsyncMock()
+
+    with patch("llm.vector_store.get_async_pool", return_value=pool):
+        result = await store.aadd_documents(["a", "b"], ["id0", "id1"], "test_user", embeddings=[[1.0], [2.0]])
+        with pytest.raises(ValueError, match="one vector per document"):
+            await store.aadd_documents(["a"], ["id0"], "test_user", embeddings=[])
+
+    assert result == "Documents added successfully."
+    store._emb.aembed_documents.assert_not_awaited()
+    rows = cur.executemany.await_args.args[1]
+    assert [row[3].to_list() for row in rows] == [[1.0], [2.0]]
+
+
 async def test_aadd_documents_raises_when_pool_missing(store):
     with patch("llm.vector_store.get_async_pool", return_value=None):
         with pytest.raises(RuntimeError, match="pool not initialized"):
@@ -84,3 +266,28 @@ def test_truncates_documents_for_embedding(store, monkeypatch):
 
     assert len(captured["docs"][0]) == 500
     assert "Error" in result  # connection failure surfaced as error string
+
+
+def test_sync_wrapper_closes_embedding_client_before_loop_ends(store):
+    """The sync path's throwaway loop must not leave pooled HTTP connections behind."""
+    import httpx
+    from llm.embeddings import EmbeddingClient
+
+    transport = httpx.MockTransport(lambda req: httpx.Response(200, json={"data": [{"index": 0, "embedding": [0.0]}]}))
+    store._emb = EmbeddingClient(base_url="http://test/v1", transport=transport)
+    opened = []
+    real_client = store._emb._client
+
+    def spy():
+        opened.append(real_client())
+        return opened[-1]
+
+    store._emb._client = spy
+    pool = MagicMock()
+    pool.connection.side_effect = RuntimeError("stop here")
+
+    with patch("llm.vector_store.get_async_pool", return_value=pool):
+        store.add_documents(["doc"], ["id1"], "u")
+
+    assert opened and all(client.is_closed for client in opened)
+    assert store._emb._http is None
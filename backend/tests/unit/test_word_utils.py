@@ -0,0 +1,89 @@
+"""Tests for the named Word styles used by the DOCX writer."""
+
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_TAB_ALIGNMENT
+from docx.oxml.ns import qn
+from docx.shared import Inches, Pt
+
+from utils.word_utils import (
+    RESUME_BODY,
+    RESUME_BULLET,
+    RESUME_ENTRY,
+    RESUME_SECTION,
+    RESUME_TITLE,
+    add_hyperlink,
+    add_hyperlinks,
+    add_resume_styles,
+    add_styled_paragraph,
+    resume_style_ids,
+)
+
+
+def test_add_resume_styles_registers_body_and_bullet_styles():
+    document = Document()
+    add_resume_styles(document)
+    add_resume_styles(document)  # idempotent
+
+    for name in (RESUME_BODY, RESUME_BULLET):
+        style = document.styles[name]
+        assert style.font.name == "Calibri"
+        assert style.font.size == Pt(10)
+        assert style.paragraph_format.alignment == WD_ALIGN_PARAGRAPH.JUSTIFY
+    assert document.styles[RESUME_BULLET].base_style.name == "List Bullet"
+
+
+def test_entry_style_carries_the_right_aligned_date_tab_stop():
+    document = Document()
+    add_resume_styles(document)
+
+    entry = document.styles[RESUME_ENTRY]
+    (tab_stop,) = entry.paragraph_format.tab_stops
+    assert tab_stop.position == Inches(6.5)
+    assert tab_stop.alignment == WD_TAB_ALIGNMENT.RIGHT
+    assert entry.base_style.name == RESUME_BODY
+
+
+def test_title_like_styles_use_explicit_font_without_theme_override():
+    document = Document()
+    add_resume_styles(document)
+
+    section = document.styles[RESUME_SECTION]
+    assert section.font.name == "Times New Roman"
+    assert section.font.size == Pt(11)
+    assert document.styles[RESUME_TITLE].font.size == Pt(16)
+    # Title's border is copied, but not its theme fonts (they would win over the font name)
+    assert section.element.pPr.find(qn("w:pBdr")) is not None
+    assert section.base_style.name == "Normal"
+    assert section.element.rPr.rFonts.get(qn("w:asciiTheme")) is None
+
+
+def test_add_styled_paragraph_matches_add_paragraph_by_name():
+    document = Document()
+    add_resume_styles(document)
+    ids = resume_style_ids(document)
+
+    by_name = document.add_paragraph("Summary", style=RESUME_BODY)
+    by_id = add_styled_paragraph(document, ids[RESUME_BODY], "Summary")
+    empty = add_styled_paragraph(document, ids[RESUME_BULLET])
+
+    assert by_id._p.xml == by_name._p.xml
+    assert by_id.style.name == RESUME_BODY
+    assert empty.style.name == RESUME_BULLET and empty.runs == []
+
+
+def test_add_hyperlinks_matches_one_by_one_links_with_separators():
+    document = Document()
+    one_by_one = document.add_paragraph()
+    add_hyperlink(one_by_one, "https://a.dev", "https://a.dev")
+    one_by_one.add_run(" • ")
+    add_hyperlink(one_by_one, "GitHub", "https://github.com/a")
+
+    bulk = document.add_paragraph()
+    add_hyperlinks(bulk, [("https://a.dev", "https://a.dev"), ("GitHub", "https://github.com/a")])
+
+    def strip_ids(p):
+        return [(child.tag, child.get(qn("r:id")) is not None, "".join(child.itertext())) for child in p._p]
+
+    assert strip_ids(bulk) == strip_ids(one_by_one)
+    assert bulk._p.xpath(".//w:rStyle/@w:val") == ["Hyperlink", "Hyperlink"]
+    assert bulk.text == "https://a.dev • GitHub"
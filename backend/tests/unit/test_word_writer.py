@@ -0,0 +1,42 @@
+"""Tests for the DOCX -> PDF conversion paths of WordResumeWriter."""
+
+import pathlib
+import threading
+from unittest.mock import patch
+
+import pandas as pd
+
+from resume.word_writer import WordResumeWriter
+
+
+def _writer(tmp_path):
+    path = tmp_path / "jobs.csv"
+    pd.DataFrame([{"type": "info", "company": "name", "description": "Jane Doe"}]).to_csv(path, index=False)
+    return WordResumeWriter(csv_location=str(path))
+
+
+def test_soffice_profile_is_reused_per_thread_and_separate_across_threads(tmp_path):
+    writer = _writer(tmp_path)
+    src = tmp_path / "resume.docx"
+    src.write_bytes(b"")
+    profiles = []
+    cleanups = []
+
+    def fake_run(cmd, **kwargs):
+        profiles.append(next(arg for arg in cmd if arg.startswith("-env:UserInstallation=")))
+        assert kwargs["timeout"] > 0
+
+    with patch("resume.word_writer.shutil.which", return_value="/usr/bin/soffice"), \
+            patch("resume.word_writer.subprocess.run", side_effect=fake_run), \
+            patch("resume.word_writer._soffice_profiles", threading.local()), \
+            patch("resume.word_writer.atexit.register", side_effect=lambda fn, path, **kw: cleanups.append(path)):
+        writer.to_pdf(str(tmp_path / "resume.pdf"), src_path=str(src))
+        writer.to_pdf(str(tmp_path / "resume.pdf"), src_path=str(src))
+        worker = threading.Thread(target=writer.to_pdf, args=(str(tmp_path / "resume.pdf"),), kwargs={"src_path": str(src)})
+        worker.start()
+        worker.join()
+
+    assert profiles[0] == profiles[1]
+    assert profiles[2] != profiles[0]
+    assert profiles[0].startswith("-env:UserInstallation=file:///")
+    assert len(cleanups) == 2 and all(pathlib.Path(path).as_uri() in " ".join(profiles) for path in cleanups)
@@ -1,16 +1,22 @@
 import os
 import logging
-import json
 import contextlib
+import functools
 import math
 import re
 from collections import Counter
+import orjson
 import psycopg
 from psycopg.adapt import Loader
+from psycopg.types.json import set_json_loads
 from psycopg_pool import ConnectionPool, AsyncConnectionPool
 from pgvector.psycopg import register_vector, register_vector_async
 from typing import Optional, Dict, Any, Tuple, List
 
+# json/jsonb columns (job_experiences.raw, cache data) decode through orjson
+# instead of the stdlib parser; applies to every connection in the process.
+set_json_loads(orjson.loads)
+
 
 class _RawBytesLoader(Loader):
     """Return text columns as raw bytes instead of decoding them.
@@ -95,6 +101,20 @@ def _top_job_keywords(conn, days: int, limit: int = 25) -> List[Dict[str, Any]]:
 _pool: Optional[ConnectionPool] = None
 _async_pool: Optional[AsyncConnectionPool] = None
 
+# SQLAlchemy-style async scheme some deployments put in DATABASE_URL; psycopg wants plain postgresql://
+_ASYNCPG_SCHEME = "postgresql+asyncpg://"
+_POSTGRES_SCHEME = "postgresql://"
+
+def _normalize_db_url(url: str) -> str:
+    if url.startswith(_ASYNCPG_SCHEME):
+        return _POSTGRES_SCHEME + url[len(_ASYNCPG_SCHEME):]
+    return url
+
+def _resolve_db_url(explicit: Optional[str] = None) -> Optional[str]:
+    """Return the explicit URL or DATABASE_URL, normalized for psycopg (None if neither is set)."""
+    url = explicit or os.getenv("DATABASE_URL")
+    return _normalize_db_url(url) if url else None
+
 def _read_int_env(name: str, default: int, min_value: int = 1) -> int:
     raw = os.getenv(name, "").strip()
     if not raw:
@@ -115,7 +135,9 @@ def _sanitize_json_value(value: Any) -> Any:
         return None
     return value
 
+@functools.lru_cache(maxsize=1)
 def _get_pool_sizes() -> Tuple[int, int, int, int]:
+    """Pool sizes from the DB_POOL_* env vars; read once per process."""
     sync_min = _read_int_env("DB_POOL_MIN_SIZE", 1)
     sync_max = _read_int_env("DB_POOL_MAX_SIZE", 5)
     async_min = _read_int_env("ASYNC_DB_POOL_MIN_SIZE", sync_min)
@@ -127,6 +149,17 @@ def _get_pool_sizes() -> Tuple[int, int, int, int]:
         async_min = async_max
     return sync_min, sync_max, async_min, async_max
 
+@functools.lru_cache(maxsize=1)
+def _get_hnsw_params() -> Tuple[int, int]:
+    """HNSW build parameters (m, ef_construction) from the PGVECTOR_HNSW_* env vars.
+
+    They only apply when the index is first built.
+    """
+    m = min(_read_int_env("PGVECTOR_HNSW_M", 24, min_value=2), 100)
+    # pgvector requires ef_construction >= 2 * m
+    ef_construction = min(max(_read_int_env("PGVECTOR_HNSW_EF_CONSTRUCTION", 128), 2 * m), 1000)
+    return m, ef_construction
+
 def _configure_sync(conn):
     try:
         register_vector(conn)
@@ -145,10 +178,8 @@ def init_db_pool(db_url: Optional[str] = None):
     if _pool is not None:
         return
 
-    url = db_url or os.getenv("DATABASE_URL")
-    if url and url.startswith("postgresql+asyncpg://"):
-        url = url.replace("postgresql+asyncpg://", "postgresql://")
-    
+    url = _resolve_db_url(db_url)
+
     if not url:
         logging.getLogger("betterresume.db_storage").warning("No DATABASE_URL found, skipping pool initialization")
         return
@@ -176,10 +207,8 @@ async def init_async_db_pool(db_url: Optional[str] = None):
     if _async_pool is not None:
         return
 
-    url = db_url or os.getenv("DATABASE_URL")
-    if url and url.startswith("postgresql+asyncpg://"):
-        url = url.replace("postgresql+asyncpg://", "postgresql://")
-    
+    url = _resolve_db_url(db_url)
+
     if not url:
         logging.getLogger("betterresume.db_storage").warning("No DATABASE_URL found, skipping async pool initialization")
         return
@@ -226,9 +255,7 @@ class DBStorage:
     Utility class to manage file and cache storage in Postgres.
     """
     def __init__(self, db_url: Optional[str] = None):
-        self.db_url = db_url or os.getenv("DATABASE_URL")
-        if self.db_url and self.db_url.startswith("postgresql+asyncpg://"):
-            self.db_url = self.db_url.replace("postgresql+asyncpg://", "postgresql://")
+        self.db_url = _resolve_db_url(db_url)
         self.logger = logging.getLogger("betterresume.db_storage")
 
     @contextlib.contextmanager
@@ -289,9 +316,22 @@ class DBStorage:
                         );
                     """)
                     
+                    # Per-user scans (exact search, deletes, counts) filter on user_id
                     cur.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_resume_vectors_embedding
-                        ON resume_vectors USING ivfflat (embedding) WITH (lists = 100);
+                        CREATE INDEX IF NOT EXISTS idx_resume_vectors_user_id
+                        ON resume_vectors (user_id);
+                    """)
+
+                    # HNSW instead of the old ivfflat index: ivfflat lists were trained on
+                    # an empty table at startup, which left per-user recall poor.
+                    cur.execute("DROP INDEX IF EXISTS idx_resume_vectors_embedding;")
+                    # Earlier halfvec expression index; no query ordered by it
+                    cur.execute("DROP INDEX IF EXISTS idx_resume_vectors_embedding_hnsw_half;")
+                    hnsw_m, hnsw_ef_construction = _get_hnsw_params()
+                    cur.execute(f"""
+                        CREATE INDEX IF NOT EXISTS idx_resume_vectors_embedding_hnsw
+                        ON resume_vectors USING hnsw (embedding vector_l2_ops)
+                        WITH (m = {hnsw_m}, ef_construction = {hnsw_ef_construction});
                     """)
                     
                     cur.execute("""
@@ -434,7 +474,7 @@ class DBStorage:
                         ON CONFLICT (user_id, cache_key)
                         DO UPDATE SET data = EXCLUDED.data, created_at = CURRENT_TIMESTAMP;
                         """,
-                        (user_id, cache_key, json.dumps(data))
+                        (user_id, cache_key, orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode())
                     )
         except Exception as e:
             self.logger.exception("Failed to save cache: %s", e)
@@ -450,7 +490,7 @@ class DBStorage:
                     )
                     row = cur.fetchone()
                     if row:
-                        return row[0] if isinstance(row[0], dict) else json.loads(row[0])
+                        return row[0] if isinstance(row[0], dict) else orjson.loads(row[0])
             return None
         except Exception as e:
             self.logger.exception("Failed to get cache: %s", e)
@@ -490,7 +530,8 @@ class DBStorage:
                                 clean_rec.get("location"),
                                 clean_rec.get("start_date"),
                                 clean_rec.get("end_date"),
-                                json.dumps(clean_rec, allow_nan=False),
+                                # NaN/inf were already mapped to None by _sanitize_json_value
+                                orjson.dumps(clean_rec).decode(),
                             ),
                         )
             self.logger.info("Replaced %d job experience rows for user=%s", len(records), user_id)
@@ -511,7 +552,7 @@ class DBStorage:
                     
                     cur.execute(query, params)
                     rows = cur.fetchall()
-                    return [row[0] if isinstance(row[0], dict) else json.loads(row[0]) for row in rows]
+                    return [row[0] if isinstance(row[0], dict) else orjson.loads(row[0]) for row in rows]
         except Exception as e:
             self.logger.exception("Failed to get job experiences: %s", e)
             return []
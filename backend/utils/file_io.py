@@ -1,5 +1,7 @@
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=32)
 def load_prompt(name: str) -> str:
     path = Path(__file__).parent.parent / "prompts" / f"{name}.txt"
     return path.read_text(encoding="utf-8")
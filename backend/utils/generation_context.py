@@ -28,6 +28,11 @@ LANGUAGE_TYPE = "language"
 
 _PRESENT_TOKENS = {"present", "current", "now", "actual"}
 
+# Compiled once: these run for every stored record on each generation
+_DMY_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+_MY_RE = re.compile(r"^(\d{1,2})/(\d{4})$")
+_YEAR_RE = re.compile(r"^\d{4}$")
+
 
 def parse_stored_date(value: Optional[str], today: date) -> Optional[date]:
     """Parse the date strings stored in job_experiences (DD/MM/YYYY, MM/YYYY, YYYY or 'present')."""
@@ -38,22 +43,21 @@ def parse_stored_date(value: Optional[str], today: date) -> Optional[date]:
         return None
     if s.lower() in _PRESENT_TOKENS:
         return today
-    m = re.match(r"^(\d{1,2})/(\d{1,2})/(\d{4})$", s)
+    m = _DMY_RE.match(s)
     if m:
         _, mm, yyyy = m.groups()
         try:
             return date(int(yyyy), int(mm), 1)
         except ValueError:
             return None
-    m = re.match(r"^(\d{1,2})/(\d{4})$", s)
+    m = _MY_RE.match(s)
     if m:
         mm, yyyy = m.groups()
         try:
             return date(int(yyyy), int(mm), 1)
         except ValueError:
             return None
-    m = re.match(r"^(\d{4})$", s)
-    if m:
+    if _YEAR_RE.match(s):
         return date(int(s), 1, 1)
     return None
 
@@ -114,7 +118,7 @@ def format_display_date(value: Optional[str], today: Optional[date] = None) -> s
         return ""
     if s.lower() in _PRESENT_TOKENS:
         return "Present"
-    if re.match(r"^\d{4}$", s):
+    if _YEAR_RE.match(s):
         return s
     parsed = parse_stored_date(s, today or date.today())
     return parsed.strftime("%m/%Y") if parsed else s
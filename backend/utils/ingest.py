@@ -1,7 +1,55 @@
 import asyncio
 import csv
+import hashlib
+import logging
 import os
-from typing import List
+from typing import Awaitable, Callable, Iterable, Iterator, List, Optional
+
+from llm.embeddings import embedding_inputs
+
+logger = logging.getLogger("betterresume.ingest")
+
+# Rows embedded and upserted per aadd_documents call; keeps the embedding payload
+# and the pending upsert batch bounded for large CSVs.
+INGEST_BATCH_SIZE = 200
+# Batches in flight at once; each holds an embedding request and a pool connection.
+INGEST_WORKERS = 4
+
+
+def _render_rows(path: str) -> Iterator[str]:
+    with open(path, newline="", encoding="utf-8") as fh:
+        for row in csv.DictReader(fh):
+            yield "\n".join(f"{key}: {value or ''}" for key, value in row.items())
+
+
+def iter_csv_documents(path: str) -> Iterator[str]:
+    """Stream a CSV as "column: value" document strings, one row at a time.
+
+    The file check happens eagerly so a missing path fails at call time rather
+    than on first iteration.
+    """
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"CSV not found: {path}")
+    return _render_rows(path)
+
+
+def _digest(doc: str) -> bytes:
+    return hashlib.blake2b(doc.encode("utf-8"), digest_size=16).digest()
+
+
+def unique_documents(docs: Iterable[str]) -> Iterator[str]:
+    """Yield each distinct document once, in first-seen order.
+
+    Duplicate rows would each pay for an embedding while adding nothing to retrieval.
+    Only 16-byte digests are remembered, so this stays cheap on a streamed CSV.
+    """
+    seen = set()
+    for doc in docs:
+        digest = _digest(doc)
+        if digest in seen:
+            continue
+        seen.add(digest)
+        yield doc
 
 
 def load_csv_documents(path: str) -> List[str]:
@@ -9,33 +57,100 @@ def load_csv_documents(path: str) -> List[str]:
 
     Mirrors the output format of langchain's CSVLoader, which this replaces.
     """
-    if not os.path.isfile(path):
-        raise FileNotFoundError(f"CSV not found: {path}")
-    docs: List[str] = []
-    with open(path, newline="", encoding="utf-8") as fh:
-        reader = csv.DictReader(fh)
-        for row in reader:
-            docs.append("\n".join(f"{key}: {value or ''}" for key, value in row.items()))
-    return docs
+    return list(iter_csv_documents(path))
 
 
-async def ingest_jobs_csv_async(path: str, store, user_id: str) -> int:
-    """Load a jobs CSV and ingest its rows into the provided PGVectorStore for a specific user.
+async def ingest_jobs_csv_async(
+    path: str,
+    store,
+    user_id: str,
+    batch_size: int = INGEST_BATCH_SIZE,
+    workers: int = INGEST_WORKERS,
+    embedder: Optional[Callable[[List[str]], Awaitable[List[List[float]]]]] = None,
+    start_index: int = 0,
+) -> int:
+    """Load a jobs CSV and ingest its distinct rows into the provided PGVectorStore for a specific user.
 
     Args:
         path: CSV file path.
         store: Initialized PGVectorStore instance.
         user_id: User id used to scope the documents.
+        batch_size: Rows sent per `aadd_documents` call. Ids stay `{user_id}_{row}`
+            across batches, and the store upserts, so re-running is safe.
+        workers: Maximum number of batches being embedded/upserted concurrently.
+        embedder: Optional async callable (e.g. `EmbeddingClient.aembed_documents` with
+            a larger chunk size) that embeds each batch before it reaches the store.
+            The store then only upserts the precomputed vectors.
+        start_index: Row number of the first id. When ingesting several CSVs for one
+            user, pass the running total of the previous return values so ids don't
+            collide; no count query against the store is needed.
 
     Returns:
-        Number of rows ingested.
+        Number of rows ingested (duplicate rows are skipped).
     """
-    docs = load_csv_documents(path)
-    ids = [f"{user_id}_{i}" for i in range(len(docs))]
-    await store.aadd_documents(docs, ids, user_id=user_id)
-    return len(docs)
+    batch_size = max(1, batch_size)
+    rows = unique_documents(iter_csv_documents(path))
+    limiter = asyncio.Semaphore(max(1, workers))
+    tasks: List[asyncio.Task] = []
+    idx = start_index
+    buf: List[str] = []
+
+    async def send(start: int, docs: List[str]) -> None:
+        # Ids are fixed when the batch is scheduled, so completion order doesn't matter
+        ids = [f"{user_id}_{start + i}" for i in range(len(docs))]
+        try:
+            if embedder is None:
+                result = await store.aadd_documents(docs, ids, user_id=user_id)
+            else:
+                # Same truncation the store applies, so the vectors match what it would compute
+                vectors = await embedder(embedding_inputs(docs))
+                result = await store.aadd_documents(docs, ids, user_id=user_id, embeddings=vectors)
+        finally:
+            limiter.release()
+        if isinstance(result, str) and result.startswith("Error"):
+            logger.warning("Ingest batch at row %d failed for user=%s: %s", start, user_id, result)
 
+    async def flush() -> None:
+        # Parsing waits for a free slot, so at most `workers` batches are held in memory
+        await limiter.acquire()
+        tasks.append(asyncio.create_task(send(idx, buf)))
 
-def ingest_jobs_csv(path: str, store, user_id: str) -> int:
+    try:
+        for doc in rows:
+            buf.append(doc)
+            if len(buf) == batch_size:
+                await flush()
+                idx += len(buf)
+                buf = []
+        if buf:
+            await flush()
+            idx += len(buf)
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return idx - start_index
+
+
+def ingest_jobs_csv(
+    path: str,
+    store,
+    user_id: str,
+    batch_size: int = INGEST_BATCH_SIZE,
+    workers: int = INGEST_WORKERS,
+    embedder: Optional[Callable[[List[str]], Awaitable[List[List[float]]]]] = None,
+    start_index: int = 0,
+) -> int:
     """Synchronous wrapper around ingest_jobs_csv_async for CLI/legacy callers."""
-    return asyncio.run(ingest_jobs_csv_async(path, store, user_id))
+    async def run() -> int:
+        try:
+            return await ingest_jobs_csv_async(
+                path, store, user_id, batch_size=batch_size, workers=workers, embedder=embedder, start_index=start_index
+            )
+        finally:
+            # Release the store's HTTP connections while their loop is still alive.
+            close = getattr(store, "aclose", None)
+            if close is not None:
+                await close()
+
+    return asyncio.run(run())
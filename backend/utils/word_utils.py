@@ -1,7 +1,10 @@
+import copy
+import functools
+
 import docx
-from docx.shared import  Pt  
-from docx import Document
-from docx.enum.text import WD_ALIGN_PARAGRAPH 
+from docx.shared import  Inches, Pt  
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_TAB_ALIGNMENT
+from docx.oxml.ns import qn
 
 
 def get_or_create_hyperlink_style(d):
@@ -34,48 +37,127 @@ def get_or_create_hyperlink_style(d):
     return "Hyperlink"
 
 
-def add_hyperlink(paragraph, text, url):
-    # This gets access to the document.xml.rels file and gets a new relation id value
-    part = paragraph.part
-    r_id = part.relate_to(
-        url, docx.opc.constants.RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
+def _hyperlink_style_id(document):
+    # Defines the builtin hyperlink style if necessary
+    return document.styles[get_or_create_hyperlink_style(document)].style_id
+
 
-    # Create the w:hyperlink tag and add needed values
+@functools.lru_cache(maxsize=8)
+def _hyperlink_template(style_id):
+    """<w:hyperlink><w:r><w:rPr><w:rStyle/></w:rPr><w:t/></w:r></w:hyperlink>, built once."""
+    run = docx.oxml.shared.OxmlElement('w:r')
+    # Style id set on the element directly; the name lookup scans every style
+    run.style = style_id
+    run.append(docx.oxml.shared.OxmlElement('w:t'))
     hyperlink = docx.oxml.shared.OxmlElement('w:hyperlink')
-    hyperlink.set(docx.oxml.shared.qn('r:id'), r_id, )
+    hyperlink.append(run)
+    return hyperlink
 
-    # Create a new run object (a wrapper over a 'w:r' element)
-    new_run = docx.text.run.Run(
-        docx.oxml.shared.OxmlElement('w:r'), paragraph)
-    new_run.text = text
 
-    # Set the run's style to the builtin hyperlink style, defining it if necessary
-    new_run.style = get_or_create_hyperlink_style(part.document)
-    # Alternatively, set the run's formatting explicitly
-    # new_run.font.color.rgb = docx.shared.RGBColor(0, 0, 255)
-    # new_run.font.underline = True
+def _append_hyperlink(paragraph, text, url, style_id):
+    # This gets access to the document.xml.rels file and gets a new relation id value
+    r_id = paragraph.part.relate_to(
+        url, docx.opc.constants.RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
 
-    # Join all the xml elements together
-    hyperlink.append(new_run._element)
+    # Copy the prebuilt hyperlink/run elements and fill in the id and text
+    hyperlink = copy.deepcopy(_hyperlink_template(style_id))
+    hyperlink.set(qn('r:id'), r_id)
+    t = hyperlink.find(f"{qn('w:r')}/{qn('w:t')}")
+    t.text = text
+    if text != text.strip():
+        t.set(qn('xml:space'), 'preserve')
     paragraph._p.append(hyperlink)
     return hyperlink
 
 
-def set_paragraph_font(paragraph, font_name="Calibri", font_size=10):
-    """Set font name and size for a paragraph."""
-    for run in paragraph.runs:
-        run.font.name = font_name
-        run.font.size = Pt(font_size)
+def add_hyperlink(paragraph, text, url):
+    return _append_hyperlink(paragraph, text, url, _hyperlink_style_id(paragraph.part.document))
+
+
+def add_hyperlinks(paragraph, links, separator=" • "):
+    """Append (text, url) hyperlinks to `paragraph`, separated by plain `separator` runs.
 
+    The hyperlink style is looked up once for the whole batch. A link that cannot be
+    added is written as plain text instead.
+    """
+    style_id = None
+    for i, (text, url) in enumerate(links):
+        if i:
+            paragraph.add_run(separator)
+        try:
+            if style_id is None:
+                style_id = _hyperlink_style_id(paragraph.part.document)
+            _append_hyperlink(paragraph, text, url, style_id)
+        except Exception:
+            paragraph.add_run(text)
 
-def set_heading_font(paragraph, font_name="Times New Roman", font_size=16):
-    """Set font name and size for a heading."""
-    for run in paragraph.runs:
-        run.font.name = font_name
-        run.font.size = Pt(font_size)
 
+RESUME_BODY = "Resume Body"
+RESUME_BULLET = "Resume Bullet"
+RESUME_ENTRY = "Resume Entry"
+RESUME_NAME = "Resume Name"
+RESUME_TITLE = "Resume Title"
+RESUME_SECTION = "Resume Section"
+RESUME_STYLES = (RESUME_BODY, RESUME_BULLET, RESUME_ENTRY, RESUME_NAME, RESUME_TITLE, RESUME_SECTION)
 
-def set_paragraph_format(paragraph, line_spacing=1.0, alignment=WD_ALIGN_PARAGRAPH.JUSTIFY):
-    """Set line spacing and alignment for a paragraph."""
-    paragraph.paragraph_format.line_spacing = line_spacing
-    paragraph.alignment = alignment
+
+def resume_style_ids(d):
+    """{style name: style id} for the resume styles registered on `d`."""
+    return {name: d.styles[name].style_id for name in RESUME_STYLES}
+
+
+def add_styled_paragraph(container, style_id, text=""):
+    """`container.add_paragraph(text, style=...)` with an already-resolved style id.
+
+    python-docx resolves a style name by scanning every style definition in the
+    document on each call, which was most of the time spent building a resume.
+    """
+    paragraph = container.add_paragraph()
+    if text:
+        paragraph.add_run(text)
+    paragraph._p.style = style_id
+    return paragraph
+
+
+def _add_paragraph_style(d, name, base, font_name, font_size, copy_look_from=None):
+    style = d.styles.add_style(name, docx.enum.style.WD_STYLE_TYPE.PARAGRAPH)
+    style.base_style = d.styles[base]
+    if copy_look_from is not None:
+        # Borders, spacing and colour are copied; fonts/sizes are set explicitly below
+        source = d.styles[copy_look_from].element
+        if source.pPr is not None:
+            ppr = style.element.get_or_add_pPr()
+            for child in source.pPr:
+                ppr.append(copy.deepcopy(child))
+        if source.rPr is not None:
+            rpr = copy.deepcopy(source.rPr)
+            for child in list(rpr):
+                if child.tag in (qn("w:rFonts"), qn("w:sz"), qn("w:szCs")):
+                    rpr.remove(child)
+            style.element._insert_rPr(rpr)
+    style.font.name = font_name
+    style.font.size = Pt(font_size)
+    return style
+
+
+def add_resume_styles(d, body_font="Calibri", body_size=10, heading_font="Times New Roman"):
+    """Register the named paragraph styles the Word writer uses.
+
+    Paragraphs reference a style instead of every run carrying its own font
+    properties, which keeps document.xml small and also covers runs added after
+    the paragraph is created.
+    """
+    if RESUME_BODY in d.styles:
+        return
+    for name, base in ((RESUME_BODY, "Normal"), (RESUME_BULLET, "List Bullet")):
+        style = _add_paragraph_style(d, name, base, body_font, body_size)
+        style.paragraph_format.line_spacing = 1.0
+        style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+    # Entry lines (experience header, education) right-align their dates on a tab stop
+    entry = d.styles.add_style(RESUME_ENTRY, docx.enum.style.WD_STYLE_TYPE.PARAGRAPH)
+    entry.base_style = d.styles[RESUME_BODY]
+    entry.paragraph_format.tab_stops.add_tab_stop(Inches(6.5), WD_TAB_ALIGNMENT.RIGHT)
+    _add_paragraph_style(d, RESUME_NAME, "Normal", heading_font, 16)
+    # Title's look, based on Normal: Title's theme fonts would override the font name
+    _add_paragraph_style(d, RESUME_TITLE, "Normal", heading_font, 16, copy_look_from="Title")
+    _add_paragraph_style(d, RESUME_SECTION, "Normal", heading_font, 11, copy_look_from="Title")